@@ -0,0 +1,172 @@
+import asyncio
+
+import Mattermost_Base as _base
+
+
+class AsyncBase:
+    __slots__ = ('token', 'base_url', 'api_url', 'error_desc', 'http2',
+                 '_session', '__weakref__')
+
+    def __init__(self, token: str, server_url: str, version: str = "v4",
+                 http2: bool = False):
+        self.token = f"Bearer {token}"
+        self.base_url = server_url.rstrip('/') + '/api/' + version.rstrip('/')
+        self.error_desc = None
+        self.http2 = http2
+        self._session = None
+
+    def _get_session(self):
+        """
+            Возвращает общую сессию, создавая её при первом обращении.
+
+            При http2=True используется httpx.AsyncClient с HTTP/2:
+            параллельные запросы мультиплексируются по одному TCP/TLS
+            соединению. Иначе — aiohttp.ClientSession с keep-alive и
+            пулом соединений.
+
+            :return: Общая сессия с keep-alive и пулом соединений.
+        """
+        if (self._session is None
+                or getattr(self._session, 'closed', False)
+                or getattr(self._session, 'is_closed', False)):
+            if self.http2:
+                import httpx
+                self._session = httpx.AsyncClient(
+                    http2=True,
+                    headers={'Authorization': self.token},
+                    timeout=httpx.Timeout(10.0, connect=5.0),
+                    limits=httpx.Limits(max_connections=32,
+                                        max_keepalive_connections=32))
+            else:
+                # Ленивый импорт: aiohttp нужен только этой ветке,
+                # и сам пакет должен импортироваться без него.
+                import aiohttp
+                self._session = aiohttp.ClientSession(
+                    headers={'Authorization': self.token},
+                    connector=aiohttp.TCPConnector(limit=100,
+                                                   keepalive_timeout=75,
+                                                   ttl_dns_cache=300))
+        return self._session
+
+    async def close(self) -> None:
+        """
+            Закрывает aiohttp-сессию и освобождает соединения пула.
+        """
+        if self._session is None:
+            return
+        if hasattr(self._session, 'aclose'):
+            if not self._session.is_closed:
+                await self._session.aclose()
+        elif not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def request(self, url: str,
+                      params: dict = None,
+                      body: dict = None,
+                      request_type: str = 'GET') -> dict:
+        """
+          Делает асинхронный запрос с указанными параметрами по URL.
+
+          :param url: URL запроса.
+          :type url: :obj:`base.String`
+          :param params: Query parameters запроса.
+          :param body: json Body запроса.
+          :param request_type: Метод запроса.
+          :type request_type: :obj:`base.String`
+          :return: Словарь с результатами запроса.
+          :rtype: :obj:'typing.Dict'
+        """
+
+        session = self._get_session()
+
+        if not _base._json_resolved:
+            _base._resolve_json()
+
+        json = body
+        data = None
+        headers = None
+        if body is not None and _base._dumps is not None:
+            data = _base._dumps(body)
+            json = None
+            headers = {'Content-Type': 'application/json'}
+
+        try:
+            if self.http2:
+                response = await session.request(request_type, url,
+                                                 params=params,
+                                                 headers=headers,
+                                                 content=data,
+                                                 json=json)
+                if response.status_code in (200, 201, 204):
+                    if not response.content:
+                        return {}
+                    if _base._loads is not None:
+                        return _base._loads(response.content)
+                    return response.json()
+                elif response.status_code == 401:
+                    print("UnauthorizedError", response.json()['message'])
+            else:
+                async with session.request(request_type, url,
+                                           params=params,
+                                           headers=headers,
+                                           data=data,
+                                           json=json) as response:
+                    if response.status in (200, 201, 204):
+                        raw = await response.read()
+                        if not raw:
+                            return {}
+                        if _base._loads is not None:
+                            return _base._loads(raw)
+                        return await response.json()
+                    elif response.status == 401:
+                        payload = await response.json()
+                        print("UnauthorizedError", payload['message'])
+        except Exception as err:
+            self.error_desc = err
+
+        print(f"Request ERROR: {self.error_desc}")
+        return {}
+
+    async def paginate_all(self, fetch,
+                           per_page: int = 200,
+                           concurrency: int = 8) -> list:
+        """
+          Обходит все страницы пагинируемого endpoint, запрашивая
+          по `concurrency` страниц одновременно через asyncio.gather.
+
+          fetch должна возвращать список записей либо словарь с ключом
+          'order' (форма ответа постов Mattermost) — по нему считается
+          длина страницы. Иная форма останавливает обход после первой
+          страницы, а не зацикливает его.
+
+          :param fetch: Корутина вида fetch(page, per_page), возвращающая одну страницу.
+          :param per_page: Количество записей на страницу.
+          :param concurrency: Количество одновременно запрашиваемых страниц.
+          :return: Список ответов по страницам в порядке следования.
+          :rtype: :obj:'typing.List'
+        """
+
+        pages = []
+        page = 0
+        while True:
+            batch = await asyncio.gather(
+                *[fetch(p, per_page) for p in range(page, page + concurrency)])
+            done = False
+            for chunk in batch:
+                items = chunk.get('order') if isinstance(chunk, dict) else chunk
+                if not items:
+                    done = True
+                    break
+                pages.append(chunk)
+                if not isinstance(items, list) or len(items) < per_page:
+                    done = True
+                    break
+            if done:
+                return pages
+            page += concurrency
@@ -1,19 +1,382 @@
 from typing import Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+import gzip
 import os
+import re
+import sys
+import time
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Опциональные зависимости (orjson, httpx, zstandard) подключаются
+# лениво при первом использовании: импорт модуля остаётся дешёвым для
+# короткоживущих скриптов и CLI, которые делают один-два вызова.
+_json_resolved = False
+_dumps = None
+_loads = None
+_msgspec = None
+_typed_decoders = {}
+
+
+def _resolve_json() -> None:
+    """
+        Одноразово привязывает быстрые _dumps/_loads на уровне модуля.
+
+        Предпочитает msgspec (кодер на уровне Cython, быстрее orjson на
+        структурированных телах), затем orjson с заранее собранными
+        OPT-флагами (numpy-типы, наивные datetime, нестроковые ключи).
+        Без обеих библиотек привязывается стандартный json с компактными
+        разделителями: тело всё равно уходит готовыми байтами через
+        data=, и request() работает по одному и тому же пути.
+
+    """
+    global _json_resolved, _dumps, _loads, _msgspec
+    _json_resolved = True
+
+    try:
+        import msgspec
+    except ImportError:
+        pass
+    else:
+        _msgspec = msgspec
+        _dumps = msgspec.json.Encoder().encode
+        _loads = msgspec.json.Decoder().decode
+        return
+
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        def dumps(obj, _dumps=json.dumps) -> bytes:
+            return _dumps(obj, separators=(',', ':')).encode()
+
+        _dumps = dumps
+        _loads = json.loads
+        return
+
+    options = (orjson.OPT_SERIALIZE_NUMPY
+               | orjson.OPT_NAIVE_UTC
+               | orjson.OPT_NON_STR_KEYS)
+
+    def dumps(obj, _dumps=orjson.dumps, _options=options) -> bytes:
+        return _dumps(obj, option=_options)
+
+    _dumps = dumps
+    _loads = orjson.loads
+
+
+def _decode_as(content: bytes, response_type):
+    """
+        Декодирует тело ответа сразу в указанный тип через msgspec,
+        минуя промежуточный dict. Декодер на тип создаётся один раз
+        и переиспользуется.
+
+        :param content: Байты тела ответа.
+        :param response_type: Целевой тип (msgspec.Struct, list[...]).
+        :return: Экземпляр response_type.
+    """
+    decode = _typed_decoders.get(response_type)
+    if decode is None:
+        decode = _msgspec.json.Decoder(response_type).decode
+        _typed_decoders[response_type] = decode
+    return decode(content)
+
+
+_zstd_resolved = False
+_zstd_compressor = None
+
+
+def _resolve_zstd() -> None:
+    """
+        Одноразово подключает zstandard и создаёт переиспользуемый
+        компрессор. Без zstandard компрессор остаётся None, и сжатие
+        тела идёт через gzip из стандартной библиотеки.
+
+    """
+    global _zstd_resolved, _zstd_compressor
+    _zstd_resolved = True
+    try:
+        import zstandard
+    except ImportError:
+        return
+    _zstd_compressor = zstandard.ZstdCompressor(level=3)
+
+_COMPRESS_THRESHOLD = 2048
+
+# Предвычисленные токены для boolean query-параметров: сервер ожидает
+# "true"/"false" в нижнем регистре, а таблица избавляет от str() на
+# каждый вызов.
+_BOOL_TOKENS = {True: 'true', False: 'false'}
+
+_refresh_pool = ThreadPoolExecutor(max_workers=4)
+
+# Идентификаторы Mattermost — 26 символов [a-z0-9]. Скомпилированный
+# один раз шаблон ловит опечатки на клиенте до сетевого round trip.
+_MM_ID = re.compile(r'^[a-z0-9]{26}$')
+
+
+def check_id(value: str) -> str:
+    """
+        Проверяет, что значение похоже на идентификатор Mattermost.
+
+        :param value: Проверяемый идентификатор.
+        :type value: :obj:`base.String`
+        :return: То же значение, если проверка прошла.
+        :raises ValueError: Если значение не 26-символьный id.
+    """
+    if _MM_ID.match(value) is None:
+        raise ValueError(f"invalid Mattermost id: {value!r}")
+    return value
+
+
+def cached_get(ttl: float = 60):
+    """
+        Декоратор TTL-кэша для идемпотентных GET-методов.
+
+        Повторный вызов с теми же аргументами в пределах ttl возвращает
+        закэшированный ответ без обращения к серверу. Между ttl и 2*ttl
+        возвращается устаревший ответ, а обновление выполняется в фоне
+        (stale-while-revalidate). После 2*ttl запрос идёт на сервер.
+
+        :param ttl: Время жизни записи кэша в секундах.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            key = (func.__name__, args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            entry = self._cache.get(key)
+            if entry is not None:
+                timestamp, value = entry
+                age = now - timestamp
+                if age < ttl:
+                    return value
+                if age < 2 * ttl:
+                    def refresh():
+                        try:
+                            self._cache[key] = (time.monotonic(),
+                                                func(self, *args, **kwargs))
+                        except Exception:
+                            pass
+                    _refresh_pool.submit(refresh)
+                    return value
+            value = func(self, *args, **kwargs)
+            self._cache[key] = (time.monotonic(), value)
+            return value
+        return wrapper
+    return decorator
+
+
+def make_call(request_type: str, path: str,
+              path_params: tuple = (),
+              required: tuple = (),
+              optional: tuple = (),
+              send: str = None,
+              doc: str = None):
+    """
+        Фабрика методов endpoint'а по декларативной спецификации.
+
+        Генерирует через exec готовую функцию-метод: URL собирается
+        f-строкой из path_params, обязательные параметры кладутся в
+        dict-литерал без проверок на None, а необязательные — одним
+        dict comprehension без цепочки условных add_to_json/add_query_param.
+
+        :param request_type: Метод запроса (GET, POST, ...).
+        :type request_type: :obj:`base.String`
+        :param path: Шаблон пути относительно api_url, например '/{team_id}'.
+        :type path: :obj:`base.String`
+        :param path_params: Имена обязательных аргументов, входящих в путь.
+        :param required: Имена обязательных параметров запроса.
+        :param optional: Имена необязательных параметров запроса.
+        :param send: Куда класть параметры: 'params', 'body' или None.
+        :param doc: Docstring сгенерированного метода.
+        :return: Функция-метод для класса-наследника Base.
+    """
+
+    args = list(path_params) + list(required)
+    args += [f"{name}=None" for name in optional]
+    fixed = ", ".join(f"{name!r}: {name}" for name in required)
+    pairs = ", ".join(f"({name!r}, {name})" for name in optional)
+    if pairs:
+        build = f"{{{fixed}}}" if fixed else "{}"
+        build += f"; _d.update({{k: v for k, v in ({pairs},) if v is not None}})"
+    else:
+        build = f"{{{fixed}}}"
+
+    src = f"def call(self{''.join(', ' + a for a in args)}):\n"
+    src += f"    url = self.api_url + f{path!r}\n"
+    if send == 'params':
+        src += f"    _d = {build}\n"
+        src += f"    return self.request(url, request_type={request_type!r}, params=_d)\n"
+    elif send == 'body':
+        src += f"    _d = {build}\n"
+        src += f"    return self.request(url, request_type={request_type!r}, body=_d)\n"
+    elif request_type == 'GET':
+        src += f"    return self.request(url, request_type='GET')\n"
+    else:
+        src += f"    return self._request_nobody(url, {request_type!r})\n"
+
+    namespace = {}
+    exec(compile(src, '<make_call>', 'exec'), namespace)
+    call = namespace['call']
+    call.__doc__ = doc
+    return call
+
+
+def endpoints(table: dict):
+    """
+        Класс-декоратор: генерирует методы endpoint'ов из декларативной
+        таблицы {имя: спецификация make_call} один раз при импорте модуля.
+
+        Каждая строка таблицы компилируется в отдельную функцию без
+        цепочек `if x is not None` и без повторных attribute lookup'ов
+        reset/add_to_json на горячем пути.
+
+        :param table: Словарь имя метода -> kwargs для make_call.
+        Ключ 'ttl' оборачивает метод в cached_get с указанным TTL.
+        :return: Декоратор класса-наследника Base.
+    """
+    def apply(cls):
+        for name, spec in table.items():
+            spec = dict(spec)
+            ttl = spec.pop('ttl', None)
+            call = make_call(**spec)
+            # Имя присваивается до оборачивания в cached_get: ключ кэша
+            # строится из func.__name__, и без этого все ttl-методы
+            # класса делили бы одну запись под именем 'call'.
+            call.__name__ = name
+            call.__qualname__ = f"{cls.__name__}.{name}"
+            if ttl is not None:
+                call = cached_get(ttl)(call)
+            setattr(cls, name, call)
+        return cls
+    return apply
 
 
 class Base:
-    def __init__(self, token: str, server_url: str, version: str = "v4"):
+    __slots__ = ('token', 'headers', 'base_url', 'api_url', 'body', 'data',
+                 'cookies', 'error_desc', 'files', 'compress_body', '_cache',
+                 '_etags', '_session', '_default_headers', '_json_headers',
+                 'last_status', '__weakref__')
+
+    def __init__(self, token: str, server_url: str, version: str = "v4",
+                 http2: bool = False):
         self.token = f"Bearer {token}"
-        self.headers = {'Authorization': f'{self.token}'}
+        self._default_headers = {'Authorization': self.token}
+        self._json_headers = {'Authorization': self.token,
+                              'Content-Type': 'application/json'}
+        self.headers = self._default_headers
         self.base_url = server_url.rstrip('/') + '/api/' + version.rstrip('/')
         self.body = None
         self.data = None
         self.cookies = None
         self.error_desc = None
+        self.last_status = None
         self.files = None
+        self.compress_body = False
+        self._cache = {}
+        self._etags = {}
+        if http2:
+            try:
+                import httpx
+            except ImportError:
+                httpx = None
+        if http2 and httpx is not None:
+            self._session = httpx.Client(
+                http2=True,
+                headers={'Authorization': self.token,
+                         'Accept': 'application/json'},
+                timeout=httpx.Timeout(10.0, connect=5.0),
+                limits=httpx.Limits(max_connections=50,
+                                    max_keepalive_connections=20))
+        else:
+            self._session = requests.Session()
+            self._session.headers['Authorization'] = self.token
+            self._session.headers['Accept'] = 'application/json'
+            retry = Retry(total=5,
+                          backoff_factor=0.3,
+                          status_forcelist=(429, 500, 502, 503, 504),
+                          allowed_methods=frozenset(
+                              ['GET', 'POST', 'PUT', 'PATCH', 'DELETE']),
+                          respect_retry_after_header=True)
+            adapter = HTTPAdapter(pool_connections=10,
+                                  pool_maxsize=100,
+                                  max_retries=retry)
+            self._session.mount('http://', adapter)
+            self._session.mount('https://', adapter)
+
+    def close(self) -> None:
+        """
+            Закрывает HTTP-сессию и освобождает соединения пула.
+        """
+        self._close_files()
+        self._session.close()
+
+    def _close_files(self) -> None:
+        """
+            Закрывает дескрипторы, открытые add_file, и очищает
+            накопленный словарь файлов: без этого каждый вызов
+            add_file навсегда терял файловый дескриптор.
+        """
+        files = self.files
+        self.files = None
+        if not files:
+            return
+        for value in files.values():
+            handle = (value[1]
+                      if isinstance(value, tuple) and len(value) > 1
+                      else value)
+            close = getattr(handle, 'close', None)
+            if close is not None:
+                try:
+                    close()
+                except Exception:
+                    pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    _api_url_cache = {}
+
+    def _make_api_url(self, suffix: str) -> str:
+        """
+            Собирает api_url из base_url и суффикса класса с кэшированием
+            на уровне класса и sys.intern результата: повторные инстансы
+            с тем же server_url не платят за f-строку, а сравнение URL
+            дальше по коду сводится к сравнению указателей.
+
+            :param suffix: Суффикс пути API, например '/posts'.
+            :type suffix: :obj:`base.String`
+            :return: Полный URL данного API.
+            :rtype: :obj:`base.String`
+        """
+        key = (self.base_url, suffix)
+        url = self._api_url_cache.get(key)
+        if url is None:
+            url = self._api_url_cache.setdefault(
+                key, sys.intern(self.base_url + suffix))
+        return url
+
+    def invalidate(self, prefix: str = None) -> None:
+        """
+            Удаляет записи TTL-кэша, чьи методы начинаются с prefix.
+            Вызывается мутирующими методами для сброса устаревших ответов.
+
+            :param prefix: Префикс имени метода; None очищает весь кэш.
+            :type prefix: :obj:`base.String`
+        """
+        if prefix is None:
+            self._cache.clear()
+            return
+        for key in [k for k in self._cache if k[0].startswith(prefix)]:
+            del self._cache[key]
 
     def reset(self) -> None:
         """
@@ -22,7 +385,8 @@ class Base:
         self.body = None
         self.data = None
         self.cookies = None
-        self.headers = {'Authorization': f'{self.token}'}
+        self._close_files()
+        self.headers = self._default_headers
 
     def add_cookie(self, key: str, value: str) -> None:
         """
@@ -56,24 +420,24 @@ class Base:
         """
             Добавляет заголовок в запрос для отправки JSON.
         """
-        if self.headers is None:
-            self.headers = {}
+        if self.headers is None or self.headers is self._default_headers:
+            self.headers = dict(self._default_headers)
         self.headers.update({'Content-Type': 'application/json'})
 
     def add_application_www_form_header(self) -> None:
         """
             Добавляет заголовок в запрос для отправки x-www-form.
         """
-        if self.headers is None:
-            self.headers = {}
+        if self.headers is None or self.headers is self._default_headers:
+            self.headers = dict(self._default_headers)
         self.headers.update({'Content-Type': 'application/x-www-form-urlencoded'})
 
     def add_multipart_form_data_header(self) -> None:
         """
             Добавляет заголовок в запрос для отправки multipart/form-data.
         """
-        if self.headers is None:
-            self.headers = {}
+        if self.headers is None or self.headers is self._default_headers:
+            self.headers = dict(self._default_headers)
         self.headers.update({'Content-Type': 'multipart/form-data'})
 
     def add_to_json(self, key: str, value: Union[str, dict, list, tuple, int, bool]) -> None:
@@ -94,14 +458,15 @@ class Base:
         """
         Добавляет файл к телу запроса.
 
+        Файл открывается в бинарном режиме и передаётся открытым
+        дескриптором, чтобы requests читал его по частям при отправке,
+        а не держал всё содержимое в памяти.
+
         :param file_path: Полный путь до файла.
         """
 
-        data = None
-
         try:
-            with open(file_path, 'r') as f:
-                data = f.read()
+            f = open(file_path, 'rb')
         except Exception as err:
             return
 
@@ -110,58 +475,254 @@ class Base:
 
         filename = os.path.basename(file_path)
 
-        self.files.update({filename: (filename, data)})
+        self.files.update({filename: (filename, f)})
+
+    def _get_raw(self, url: str) -> bytes:
+        """
+          Возвращает тело ответа как байты без попытки разбора JSON.
+          Работает с обоими транспортами: requests.Session читает
+          потоково, httpx.Client — обычным запросом (у него нет
+          параметра stream у get()).
+
+          :param url: URL запроса.
+          :return: Байты тела ответа.
+        """
+        session = self._session
+        if isinstance(session, requests.Session):
+            with session.get(url, headers=self.headers,
+                             stream=True) as response:
+                response.raise_for_status()
+                return response.content
+        response = session.get(url, headers=self.headers)
+        response.raise_for_status()
+        return response.content
+
+    def _download_to(self, url: str, dest_path: str,
+                     chunk_size: int = 65536) -> str:
+        """
+          Скачивает тело ответа на диск порциями, не буферизуя его
+          целиком в памяти. iter_content/iter_bytes отдают уже
+          раскодированные данные, так что Content-Encoding от сервера
+          не попадает в файл. Работает с обоими транспортами.
+
+          :param url: URL запроса.
+          :param dest_path: Путь, по которому записывается файл.
+          :param chunk_size: Размер порции копирования в байтах.
+          :return: Путь записанного файла.
+        """
+        session = self._session
+        if isinstance(session, requests.Session):
+            with session.get(url, headers=self.headers,
+                             stream=True) as response:
+                response.raise_for_status()
+                with open(dest_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size):
+                        f.write(chunk)
+        else:
+            with session.stream('GET', url,
+                                headers=self.headers) as response:
+                response.raise_for_status()
+                with open(dest_path, 'wb') as f:
+                    for chunk in response.iter_bytes(chunk_size):
+                        f.write(chunk)
+        return dest_path
+
+    async def arequest(self, *args, **kwargs) -> dict:
+        """
+          Асинхронная обёртка над request() через asyncio.to_thread:
+          блокирующий вызов уходит в пул потоков, и несколько вызовов
+          можно перекрыть через asyncio.gather без перехода на
+          AsyncBase. asyncio импортируется лениво, чтобы не удорожать
+          импорт модуля для синхронных скриптов.
+
+          :return: Словарь с результатами запроса.
+          :rtype: :obj:'typing.Dict'
+        """
+        import asyncio
+        return await asyncio.to_thread(self.request, *args, **kwargs)
+
+    def _request_nobody(self, url: str, request_type: str = 'POST') -> dict:
+        """
+          Быстрый путь для мутаций без тела и query-параметров:
+          пропускает нормализацию params/body/files, сериализацию и
+          ETag-логику request() — один вызов сессии и разбор ответа.
+
+          :param url: URL запроса.
+          :param request_type: Метод запроса (POST/PUT/DEL).
+          :return: Словарь с результатами запроса.
+          :rtype: :obj:'typing.Dict'
+        """
+
+        method = 'DELETE' if request_type == 'DEL' else request_type
+
+        if not _json_resolved:
+            _resolve_json()
+
+        try:
+            response = self._session.request(method, url,
+                                             headers=self.headers)
+            self.last_status = response.status_code
+            if response.status_code in (200, 201, 204):
+                content = response.content
+                if not content:
+                    return {}
+                if _loads is not None:
+                    return _loads(content)
+                return response.json()
+            elif response.status_code == 401:
+                print("UnauthorizedError", response.json()['message'])
+        except Exception as err:
+            self.error_desc = err
+
+        print(f"Request ERROR: {self.error_desc}")
+        return {}
 
     def request(self, url: str,
-                params: bool = None,
-                body: bool = None,
+                params: Union[bool, dict] = None,
+                body: Union[bool, dict] = None,
                 cookies: bool = None,
                 files: bool = None,
-                request_type: str = 'GET') -> dict:
+                request_type: str = 'GET',
+                raw_body: bytes = None,
+                response_type=None) -> dict:
         """
           Делает запрос с указанными параметрами по URL
 
+          params и body могут быть переданы готовыми словарями — тогда
+          состояние экземпляра (self.data/self.body) не читается и не
+          мутируется, и один экземпляр можно безопасно использовать из
+          нескольких потоков. True сохраняет прежнее поведение с
+          чтением накопленного состояния.
+
+          raw_body позволяет передать уже сериализованный JSON (bytes)
+          без цикла разбор-сборка: байты уходят в сокет как есть,
+          корректность JSON остаётся на вызывающем.
+
           :param url: URL запроса.
           :type url: :obj:`base.String`
-          :param params: Передавать ли в запросе query Parameters.
-          :type params: :obj:`base.Boolean`
-          :param body: Передавать ли в запросе json Body.
-          :type body: :obj:`base.Boolean`
+          :param params: Query parameters запроса или True для self.data.
+          :param body: json Body запроса или True для self.body.
           :param cookies: Передавать ли в запросе cookies.
           :type cookies: :obj:`base.Boolean`
           :param files: Прикрепленные файлы.
           :param request_type: Метод запроса.
           :type request_type: :obj:`base.String`
+          :param raw_body: Готовое JSON-тело в байтах.
+          :param response_type: Тип для прямого msgspec-декодирования
+          ответа (без промежуточного dict); игнорируется без msgspec.
           :return: Словарь с результатами запроса.
           :rtype: :obj:'typing.Dict'
         """
 
-        requests_types = {
-            'GET': requests.get,
-            'POST': requests.post,
-            'PUT': requests.put,
-            'DELETE': requests.delete,
-            'PATCH': requests.patch,
-        }
+        method = 'DELETE' if request_type == 'DEL' else request_type
+
+        if not _json_resolved:
+            _resolve_json()
+        # Снимок модульных хуков в локальные имена: LOAD_FAST вместо
+        # повторных LOAD_GLOBAL на горячем пути.
+        dumps = _dumps
+        loads = _loads
 
         try:
-            data = self.data if params is not None else None
-            json = self.body if body is not None else None
+            if params is not None and not isinstance(params, dict):
+                params = self.data
+            if params:
+                params = {k: _BOOL_TOKENS.get(v, v) if isinstance(v, bool)
+                          else v
+                          for k, v in params.items()}
+            else:
+                params = None
+            json = body if isinstance(body, (dict, list, tuple)) else (
+                self.body if body is not None else None)
             cookies = self.cookies if cookies is not None else None
-            files = self.files if files is not None else None
-
-            response = requests_types[request_type](url=url,
-                                                    headers=self.headers,
-                                                    json=json,
-                                                    data=data,
-                                                    cookies=cookies,
-                                                    files=files)
+            files = files if isinstance(files, dict) else (
+                self.files if files is not None else None)
+
+            headers = self.headers
+            data = None
+            if raw_body is not None:
+                json = None
+                data = raw_body
+                headers = (self._json_headers
+                           if headers is self._default_headers
+                           else {**headers,
+                                 'Content-Type': 'application/json'})
+            elif json is not None and dumps is not None:
+                data = dumps(json)
+                json = None
+                headers = (self._json_headers
+                           if headers is self._default_headers
+                           else {**headers,
+                                 'Content-Type': 'application/json'})
+                if (self.compress_body
+                        and len(data) > _COMPRESS_THRESHOLD
+                        and method in ('POST', 'PUT', 'PATCH')):
+                    if not _zstd_resolved:
+                        _resolve_zstd()
+                    if headers is self._json_headers:
+                        headers = dict(headers)
+                    if _zstd_compressor is not None:
+                        data = _zstd_compressor.compress(data)
+                        headers['Content-Encoding'] = 'zstd'
+                    else:
+                        data = gzip.compress(data, 1)
+                        headers['Content-Encoding'] = 'gzip'
+
+            etag_key = None
+            cached = None
+            if method == 'GET':
+                try:
+                    etag_key = (url,
+                                tuple(sorted(params.items()))
+                                if params else None)
+                    cached = self._etags.get(etag_key)
+                except TypeError:
+                    etag_key = None
+                if cached is not None:
+                    headers = {**headers, 'If-None-Match': cached[0]}
+
+            if isinstance(self._session, requests.Session):
+                response = self._session.request(method, url,
+                                                 headers=headers,
+                                                 json=json,
+                                                 data=data,
+                                                 params=params,
+                                                 cookies=cookies,
+                                                 files=files)
+            else:
+                # httpx ожидает сырые байты в content=, а не в data=.
+                response = self._session.request(method, url,
+                                                 headers=headers,
+                                                 json=json,
+                                                 content=data,
+                                                 params=params,
+                                                 cookies=cookies,
+                                                 files=files)
+            self.last_status = response.status_code
+            if response.status_code == 304 and cached is not None:
+                return cached[1]
             if response.status_code in (200, 201, 204):
-                return response.json()
+                content = response.content
+                if not content:
+                    result = {}
+                elif response_type is not None and _msgspec is not None:
+                    result = _decode_as(content, response_type)
+                elif loads is not None:
+                    result = loads(content)
+                else:
+                    result = response.json()
+                if etag_key is not None:
+                    etag = response.headers.get('ETag')
+                    if etag:
+                        self._etags[etag_key] = (etag, result)
+                return result
             elif response.status_code == 401:
                 print("UnauthorizedError", response.json()['message'])
         except Exception as err:
             self.error_desc = err
+        finally:
+            if self.files is not None and files is self.files:
+                self._close_files()
 
         print(f"Request ERROR: {self.error_desc}")
         return {}
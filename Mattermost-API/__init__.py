@@ -1,6 +1,8 @@
 from . import mattermost
 from . import Mattermost_Base
+from . import Mattermost_Async_Base
 from . import mm_uploads_api
+from . import mm_uploads_async_api
 from . import mm_bleve_api
 from . import mm_compliance_api
 from . import mm_elasticsearch_api
@@ -12,15 +14,21 @@ from . import mm_permissions_api
 from . import mm_terms_of_service_api
 from . import mm_usage_api
 from . import mm_threads_api
+from . import mm_threads_async_api
 from . import mm_posts_api
+from . import mm_posts_async_api
 from . import mm_bots_api
 from . import mm_shared_channels_api
+from . import mm_users_api
+from . import mm_users_async_api
 
 
 __all__ = (
     'mattermost',
     'Mattermost_Base',
+    'Mattermost_Async_Base',
     'mm_uploads_api',
+    'mm_uploads_async_api',
     'mm_bleve_api',
     'mm_compliance_api',
     'mm_elasticsearch_api',
@@ -32,7 +40,11 @@ __all__ = (
     'mm_terms_of_service_api',
     'mm_usage_api',
     'mm_threads_api',
+    'mm_threads_async_api',
     'mm_posts_api',
+    'mm_posts_async_api',
     'mm_bots_api',
-    'mm_shared_channels_api'
+    'mm_shared_channels_api',
+    'mm_users_api',
+    'mm_users_async_api'
 )
@@ -1,3 +1,4 @@
+from Mattermost_Base import Base
 from mm_uploads_api import Uploads
 from mm_bleve_api import Bleve
 from mm_compliance_api import Compliance
@@ -13,70 +14,131 @@ from mm_shared_channels_api import SharedChannels
 from mm_threads_api import Threads
 from mm_posts_api import Posts
 from mm_bots_api import Bots
+from mm_users_api import Users
 
 
 class MattermostAPI:
-    def __init__(self, token: str, server_url: str):
+    """
+    Фасад над всеми ресурсными классами API.
+
+    Экземпляры ресурсов создаются один раз и переиспользуются, а их
+    HTTP-сессии заменяются на одну общую: один тёплый пул соединений,
+    один DNS-кэш и одна TLS-сессия на все ресурсы вместо отдельного
+    пула на каждое обращение к свойству.
+
+    При http2=True общая сессия создаётся через httpx с HTTP/2:
+    параллельные запросы мультиплексируются по одному TCP/TLS
+    соединению вместо соединения на запрос. Протокол согласуется через
+    ALPN, так что с сервером без HTTP/2 откат бесплатный; требуется
+    установленный httpx[http2].
+    """
+
+    __slots__ = ('token', 'server_url', 'http2', '_session', '_instances')
+
+    def __init__(self, token: str, server_url: str, http2: bool = False):
         self.token = token
         self.server_url = server_url
+        self.http2 = http2
+        self._session = None
+        self._instances = {}
+
+    def _api(self, cls):
+        """
+            Возвращает закэшированный экземпляр ресурсного класса,
+            подключённый к общей сессии фасада.
+
+            :param cls: Ресурсный класс-наследник Base.
+            :return: Экземпляр cls с общей сессией.
+        """
+        api = self._instances.get(cls)
+        if api is None:
+            api = cls(token=self.token, server_url=self.server_url)
+            if self._session is None and self.http2:
+                self._session = Base(self.token, self.server_url,
+                                     http2=True)._session
+            if self._session is None:
+                self._session = api._session
+            else:
+                api._session.close()
+                api._session = self._session
+            self._instances[cls] = api
+        return api
+
+    def close(self) -> None:
+        """
+            Закрывает общую сессию и все соединения пула.
+        """
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        self._instances.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
     @property
     def uploads(self):
-        return Uploads(token=self.token, server_url=self.server_url)
+        return self._api(Uploads)
 
     @property
     def bleve(self):
-        return Bleve(token=self.token, server_url=self.server_url)
+        return self._api(Bleve)
 
     @property
     def compliance(self):
-        return Compliance(token=self.token, server_url=self.server_url)
+        return self._api(Compliance)
 
     @property
     def elasticsearch(self):
-        return Elasticsearch(token=self.token, server_url=self.server_url)
+        return self._api(Elasticsearch)
 
     @property
     def exports(self):
-        return Exports(token=self.token, server_url=self.server_url)
+        return self._api(Exports)
 
     @property
     def imports(self):
-        return Imports(token=self.token, server_url=self.server_url)
+        return self._api(Imports)
 
     @property
     def integration_actions(self):
-        return IntegrationActions(token=self.token, server_url=self.server_url)
+        return self._api(IntegrationActions)
 
     @property
     def opengraph(self):
-        return Opengraph(token=self.token, server_url=self.server_url)
+        return self._api(Opengraph)
 
     @property
     def permissions(self):
-        return Permissions(token=self.token, server_url=self.server_url)
+        return self._api(Permissions)
 
     @property
     def terms(self):
-        return TermsOfService(token=self.token, server_url=self.server_url)
+        return self._api(TermsOfService)
 
     @property
     def usage(self):
-        return Usage(token=self.token, server_url=self.server_url)
+        return self._api(Usage)
 
     @property
     def shared_channels(self):
-        return SharedChannels(token=self.token, server_url=self.server_url)
+        return self._api(SharedChannels)
 
     @property
     def threads(self):
-        return Threads(token=self.token, server_url=self.server_url)
+        return self._api(Threads)
 
     @property
     def posts(self):
-        return Posts(token=self.token, server_url=self.server_url)
+        return self._api(Posts)
 
     @property
     def bots(self):
-        return Bots(token=self.token, server_url=self.server_url)
+        return self._api(Bots)
 
+    @property
+    def users(self):
+        return self._api(Users)
@@ -1,11 +1,27 @@
-from typing import Union, List, Dict
-from Mattermost_Base import Base
+import os
+
+from Mattermost_Base import Base, cached_get
+
+
+# Шаблоны путей, собранные один раз при импорте: %-подстановка на
+# горячем пути дешевле повторной f-интерполяции.
+_PATH_CONVERT_TO_BOT = '/users/%s/convert_to_bot'
+_PATH_BOT = '/%s'
+_PATH_DISABLE = '/%s/disable'
+_PATH_ENABLE = '/%s/enable'
+_PATH_ASSIGN = '/%s/assign/%s'
+_PATH_ICON = '/%s/icon'
+_PATH_CONVERT_TO_USER = '/%s/convert_to_user'
+
+__all__ = ['Bots']
 
 
 class Bots(Base):
+    __slots__ = ()
+
     def __init__(self, token: str, server_url: str):
         super().__init__(token, server_url)
-        self.api_url = f"{self.base_url}/bots"
+        self.api_url = self._make_api_url('/bots')
 
     def convert_user_into_bot(self, user_id: str) -> dict:
         """
@@ -19,11 +35,9 @@ class Bots(Base):
         :return: User conversion info
         """
 
-        url = f"{self.base_url}/users/{user_id}/convert_to_bot"
-
-        self.reset()
+        url = self.base_url + _PATH_CONVERT_TO_BOT % (user_id,)
 
-        return self.request(url, request_type='POST')
+        return self._request_nobody(url, 'POST')
 
     def create_bot(self,
                    username: str,
@@ -44,16 +58,14 @@ class Bots(Base):
 
         url = f"{self.api_url}"
 
-        self.reset()
-        self.add_application_json_header()
-        self.add_to_json('username', username)
-        if display_name is not None:
-            self.add_to_json('display_name', display_name)
-        if description is not None:
-            self.add_to_json('description', description)
+        body = {k: v for k, v in (('username', username),
+                                  ('display_name', display_name),
+                                  ('description', description))
+                if v is not None}
 
-        return self.request(url, request_type='POST', body=True)
+        return self.request(url, request_type='POST', body=body)
 
+    @cached_get(ttl=30)
     def get_bots(self,
                  page: int = None,
                  per_page: int = None,
@@ -79,18 +91,13 @@ class Bots(Base):
 
         url = f"{self.api_url}"
 
-        self.reset()
+        params = {k: v for k, v in (('page', page),
+                                    ('per_page', per_page),
+                                    ('include_deleted', include_deleted),
+                                    ('only_orphaned', only_orphaned))
+                  if v is not None}
 
-        if page is not None:
-            self.add_query_param('page', page)
-        if per_page is not None:
-            self.add_query_param('per_page', per_page)
-        if include_deleted is not None:
-            self.add_query_param('include_deleted', include_deleted)
-        if only_orphaned is not None:
-            self.add_query_param('only_orphaned', only_orphaned)
-
-        return self.request(url, request_type='GET', body=True)
+        return self.request(url, request_type='GET', params=params)
 
     def patch_bot(self,
                   bot_user_id: str,
@@ -113,18 +120,17 @@ class Bots(Base):
         :return: Bot patch info.
         """
 
-        url = f"{self.api_url}/{bot_user_id}"
+        url = self.api_url + _PATH_BOT % (bot_user_id,)
 
-        self.reset()
-        self.add_application_json_header()
-        self.add_to_json('username', username)
-        if display_name is not None:
-            self.add_to_json('display_name', display_name)
-        if description is not None:
-            self.add_to_json('description', description)
+        body = {k: v for k, v in (('username', username),
+                                  ('display_name', display_name),
+                                  ('description', description))
+                if v is not None}
+        self.invalidate('get_')
 
-        return self.request(url, request_type='PUT', body=True)
+        return self.request(url, request_type='PUT', body=body)
 
+    @cached_get(ttl=60)
     def get_bot(self,
                 bot_user_id: str,
                 include_deleted: bool = None) -> dict:
@@ -142,14 +148,12 @@ class Bots(Base):
         :return: Bot retrieval info
         """
 
-        url = f"{self.api_url}/{bot_user_id}"
-
-        self.reset()
+        url = self.api_url + _PATH_BOT % (bot_user_id,)
 
-        if include_deleted is not None:
-            self.add_query_param('include_deleted', include_deleted)
+        params = {k: v for k, v in (('include_deleted', include_deleted),)
+                  if v is not None}
 
-        return self.request(url, request_type='GET', body=True)
+        return self.request(url, request_type='GET', params=params)
 
     def disable_bot(self, bot_user_id: str) -> dict:
 
@@ -164,11 +168,11 @@ class Bots(Base):
         :return: Bot disable info
         """
 
-        url = f"{self.api_url}/{bot_user_id}/disable"
+        url = self.api_url + _PATH_DISABLE % (bot_user_id,)
 
-        self.reset()
+        self.invalidate('get_')
 
-        return self.request(url, request_type='POST')
+        return self._request_nobody(url, 'POST')
 
     def enable_bot(self, bot_user_id: str) -> dict:
 
@@ -183,11 +187,11 @@ class Bots(Base):
         :return: Bot enable info
         """
 
-        url = f"{self.api_url}/{bot_user_id}/enable"
+        url = self.api_url + _PATH_ENABLE % (bot_user_id,)
 
-        self.reset()
+        self.invalidate('get_')
 
-        return self.request(url, request_type='POST')
+        return self._request_nobody(url, 'POST')
 
     def assign_bot_to_user(self,
                            bot_user_id: str,
@@ -205,11 +209,9 @@ class Bots(Base):
         :return: Bot assign info
         """
 
-        url = f"{self.api_url}/{bot_user_id}/assign/{user_id}"
-
-        self.reset()
+        url = self.api_url + _PATH_ASSIGN % (bot_user_id, user_id)
 
-        return self.request(url, request_type='POST')
+        return self._request_nobody(url, 'POST')
 
     def get_bot_lhs_icon(self, bot_user_id: str) -> dict:
 
@@ -224,9 +226,7 @@ class Bots(Base):
         :return: Bot LHS icon info
         """
 
-        url = f"{self.api_url}/{bot_user_id}/icon"
-
-        self.reset()
+        url = self.api_url + _PATH_ICON % (bot_user_id,)
 
         return self.request(url, request_type='GET')
 
@@ -247,13 +247,12 @@ class Bots(Base):
         :return: SVG icon image info
         """
 
-        url = f"{self.api_url}/{bot_user_id}/icon"
-
-        self.reset()
-        self.add_multipart_form_data_header()
-        self.add_file(file_path=image)
+        url = self.api_url + _PATH_ICON % (bot_user_id,)
 
-        return self.request(url, request_type='POST')
+        with open(image, 'rb') as f:
+            files = {'image': (os.path.basename(image), f,
+                               'application/octet-stream')}
+            return self.request(url, request_type='POST', files=files)
 
     def delete_bot_lhs_icon_image(self, bot_user_id: str) -> dict:
 
@@ -268,11 +267,9 @@ class Bots(Base):
         :return: Icon image deletion info
         """
 
-        url = f"{self.api_url}/{bot_user_id}/icon"
-
-        self.reset()
+        url = self.api_url + _PATH_ICON % (bot_user_id,)
 
-        return self.request(url, request_type='DEL')
+        return self._request_nobody(url, 'DEL')
 
     def convert_bot_into_user(self,
                               bot_user_id: str,
@@ -310,32 +307,21 @@ class Bots(Base):
         :return: Bot conversion info.
         """
 
-        url = f"{self.api_url}/{bot_user_id}/convert_to_user"
-
-        self.reset()
-        self.add_application_json_header()
-        if set_system_admin is not None:
-            self.add_query_param('set_system_admin', set_system_admin)
-
-        if email is not None:
-            self.add_to_json('email', email)
-        if username is not None:
-            self.add_to_json('username', username)
-        if password is not None:
-            self.add_to_json('password', password)
-        if first_name is not None:
-            self.add_to_json('first_name', first_name)
-        if last_name is not None:
-            self.add_to_json('last_name', last_name)
-        if nickname is not None:
-            self.add_to_json('nickname', nickname)
-        if locale is not None:
-            self.add_to_json('locale', locale)
-        if position is not None:
-            self.add_to_json('position', position)
-        if props is not None:
-            self.add_to_json('props', props)
-        if notify_props is not None:
-            self.add_to_json('notify_props', notify_props)
-
-        return self.request(url, request_type='POST', body=True)
+        url = self.api_url + _PATH_CONVERT_TO_USER % (bot_user_id,)
+
+        params = {k: v for k, v in (('set_system_admin', set_system_admin),)
+                  if v is not None}
+        body = {k: v for k, v in (('email', email),
+                                  ('username', username),
+                                  ('password', password),
+                                  ('first_name', first_name),
+                                  ('last_name', last_name),
+                                  ('nickname', nickname),
+                                  ('locale', locale),
+                                  ('position', position),
+                                  ('props', props),
+                                  ('notify_props', notify_props))
+                if v is not None}
+
+        return self.request(url, request_type='POST', params=params,
+                            body=body)
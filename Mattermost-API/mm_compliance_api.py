@@ -1,11 +1,16 @@
-from typing import Union, List, Dict
-from Mattermost_Base import Base
+
+from Mattermost_Base import Base, cached_get
+
+
+__all__ = ['Compliance']
 
 
 class Compliance(Base):
+    __slots__ = ()
+
     def __init__(self, token: str, server_url: str):
         super().__init__(token, server_url)
-        self.api_url = f"{self.base_url}/compliance"
+        self.api_url = self._make_api_url('/compliance')
 
     def create_report(self):
         """
@@ -18,10 +23,9 @@ class Compliance(Base):
 
         url = f"{self.api_url}/reports"
 
-        self.reset()
-
-        return self.request(url, request_type='POST')
+        return self._request_nobody(url, 'POST')
 
+    @cached_get(ttl=30)
     def get_reports(self, page: int = None, per_page: int = None) -> dict:
         """
         Get a list of compliance reports previously created by page,
@@ -36,14 +40,12 @@ class Compliance(Base):
 
         url = f"{self.api_url}/reports"
 
-        self.reset()
-        if page is not None:
-            self.add_to_json('page', page)
-        if per_page is not None:
-            self.add_to_json('per_page', per_page)
+        params = {k: v for k, v in (('page', page),
+                                    ('per_page', per_page)) if v is not None}
 
-        return self.request(url, request_type='GET')
+        return self.request(url, request_type='GET', params=params)
 
+    @cached_get(ttl=300)
     def get_report(self, report_id: str) -> dict:
         """
         Get a compliance reports previously created.
@@ -56,9 +58,6 @@ class Compliance(Base):
 
         url = f"{self.api_url}/reports/{report_id}"
 
-        self.reset()
-        self.add_to_json('report_id', report_id)
-
         return self.request(url, request_type='GET')
 
     def download_report(self, report_id: str) -> dict:
@@ -73,8 +72,24 @@ class Compliance(Base):
 
         url = f"{self.api_url}/reports/{report_id}"
 
-        self.reset()
-        self.add_to_json('report_id', report_id)
-
         return self.request(url, request_type='GET')
 
+    def download_report_to(self,
+                           report_id: str,
+                           dest_path: str,
+                           chunk_size: int = 65536) -> str:
+        """
+        Download the full contents of a report straight to disk,
+        streaming the body in chunks instead of buffering it in memory.
+
+        Must have manage_system permission.
+
+        :param report_id: Compliance report GUID
+        :param dest_path: Path the file is written to
+        :param chunk_size: The copy buffer size in bytes
+        :return: The destination path
+        """
+
+        url = f"{self.api_url}/reports/{report_id}"
+
+        return self._download_to(url, dest_path, chunk_size)
@@ -1,14 +1,9 @@
-from typing import Union, List, Dict
-from Mattermost_Base import Base
+from Mattermost_Base import Base, endpoints
 
-
-class Elasticsearch(Base):
-    def __init__(self, token: str, server_url: str):
-        super().__init__(token, server_url)
-        self.api_url = f"{self.base_url}/elasticsearch"
-
-    def test_elast_config(self) -> dict:
-        """
+_ENDPOINTS = {
+    'test_elast_config': dict(
+        request_type='POST', path='/test',
+        doc="""
         Test the current Elasticsearch configuration to see
         if the Elasticsearch server can be contacted successfully.
         Optionally provide a configuration in the request body to test.
@@ -19,16 +14,10 @@ class Elasticsearch(Base):
         Must have manage_system permission.
 
         :return: Elasticsearch retreival
-        """
-
-        url = f"{self.api_url}/test"
-        self.reset()
-
-        return self.request(url, request_type='POST')
-
-    def purge_elast_indexes(self) -> dict:
-
-        """
+        """),
+    'purge_elast_indexes': dict(
+        request_type='POST', path='/purge_indexes',
+        doc="""
         Deletes all Elasticsearch indexes and their contents.
         After calling this endpoint, it is necessary to schedule
         a new Elasticsearch indexing job to repopulate the indexes.
@@ -37,9 +26,17 @@ class Elasticsearch(Base):
         Must have manage_system permission.
 
         :return: Elasticsearch retreival
-        """
+        """),
+}
+
 
-        url = f"{self.api_url}/purge_indexes"
-        self.reset()
+__all__ = ['Elasticsearch']
 
-        return self.request(url, request_type='POST')
\ No newline at end of file
+
+@endpoints(_ENDPOINTS)
+class Elasticsearch(Base):
+    __slots__ = ()
+
+    def __init__(self, token: str, server_url: str):
+        super().__init__(token, server_url)
+        self.api_url = self._make_api_url('/elasticsearch')
@@ -1,11 +1,17 @@
-from typing import Union, List, Dict
+from urllib.parse import quote_from_bytes as _quote_bytes
+
 from Mattermost_Base import Base
 
 
+__all__ = ['Exports']
+
+
 class Exports(Base):
+    __slots__ = ()
+
     def __init__(self, token: str, server_url: str):
         super().__init__(token, server_url)
-        self.api_url = f"{self.base_url}/exports"
+        self.api_url = self._make_api_url('/exports')
 
     def list_export_files(self) -> dict:
         """
@@ -19,8 +25,6 @@ class Exports(Base):
 
         url = f"{self.api_url}"
 
-        self.reset()
-
         return self.request(url, request_type='GET')
 
     def download_export_file(self, export_name: str) -> dict:
@@ -34,13 +38,33 @@ class Exports(Base):
         :return: Download info
         """
 
-        url = f"{self.api_url}/{export_name}"
-
-        self.reset()
-        self.add_to_json('export_name', export_name)
+        url = self.api_url + '/' + _quote_bytes(
+            export_name.encode('utf-8'), safe=b'')
 
         return self.request(url, request_type='GET')
 
+    def download_export_file_to(self,
+                                export_name: str,
+                                dest_path: str,
+                                chunk_size: int = 65536) -> str:
+        """
+        Downloads an export file straight to disk, streaming the body in
+        chunks instead of buffering the whole archive in memory.
+
+        Minimum server version: 5.33
+        Must have manage_system permissions.
+
+        :param export_name: The name of the export file to download
+        :param dest_path: Path the file is written to
+        :param chunk_size: The copy buffer size in bytes
+        :return: The destination path
+        """
+
+        url = self.api_url + '/' + _quote_bytes(
+            export_name.encode('utf-8'), safe=b'')
+
+        return self._download_to(url, dest_path, chunk_size)
+
     def delete_export_file(self, export_name: str) -> dict:
         """
         Deletes an export file.
@@ -52,9 +76,7 @@ class Exports(Base):
         :return: Delete info
         """
 
-        url = f"{self.api_url}/{export_name}"
-
-        self.reset()
-        self.add_to_json('export_name', export_name)
+        url = self.api_url + '/' + _quote_bytes(
+            export_name.encode('utf-8'), safe=b'')
 
-        return self.request(url, request_type='DEL')
+        return self._request_nobody(url, 'DEL')
@@ -1,23 +1,26 @@
-from typing import Union, List, Dict
-from Mattermost_Base import Base
+from Mattermost_Base import Base, endpoints
 
-
-class Imports(Base):
-    def __init__(self, token: str, server_url: str):
-        super().__init__(token, server_url)
-        self.api_url = f"{self.base_url}/imports"
-
-    def list_import_files(self) -> dict:
-        """
+_ENDPOINTS = {
+    'list_import_files': dict(
+        request_type='GET', path='',
+        doc="""
         Lists all available import files.
 
         Minimum server version: 5.31
         Must have manage_system permissions.
 
         :return: Import files list
-        """
+        """),
+}
+
 
-        url = f"{self.api_url}"
-        self.reset()
+__all__ = ['Imports']
 
-        return self.request(url, request_type='GET')
+
+@endpoints(_ENDPOINTS)
+class Imports(Base):
+    __slots__ = ()
+
+    def __init__(self, token: str, server_url: str):
+        super().__init__(token, server_url)
+        self.api_url = self._make_api_url('/imports')
@@ -1,11 +1,15 @@
-from typing import Union, List, Dict
 from Mattermost_Base import Base
 
 
+__all__ = ['IntegrationActions']
+
+
 class IntegrationActions(Base):
+    __slots__ = ()
+
     def __init__(self, token: str, server_url: str):
         super().__init__(token, server_url)
-        self.api_url = f"{self.base_url}/actions/dialogs"
+        self.api_url = self._make_api_url('/actions/dialogs')
 
     def open_dialog(self, trigger_id: str,
                     url: str,
@@ -26,13 +30,11 @@ class IntegrationActions(Base):
 
         api_url = f"{self.api_url}/open"
 
-        self.reset()
-        self.add_application_json_header()
-        self.add_to_json('trigger_id', trigger_id)
-        self.add_to_json('url', url)
-        self.add_to_json('dialog', dialog)
+        body = {'trigger_id': trigger_id,
+                'url': url,
+                'dialog': dialog}
 
-        return self.request(api_url, request_type='POST', body=True)
+        return self.request(api_url, request_type='POST', body=body)
 
     def submit_dialog(self, url: str,
                       channel_id: str,
@@ -58,17 +60,12 @@ class IntegrationActions(Base):
 
         api_url = f"{self.api_url}/submit"
 
-        self.reset()
-        self.add_application_json_header()
-        self.add_to_json('url', url)
-        self.add_to_json('channel_id', channel_id)
-        self.add_to_json('team_id', team_id)
-        self.add_to_json('submission', submission)
-        if callback_id is not None:
-            self.add_to_json('callback_id', callback_id)
-        if state is not None:
-            self.add_to_json('state', state)
-        if cancelled is not None:
-            self.add_to_json('cancelled', cancelled)
-
-        return self.request(api_url, request_type='POST', body=True)
+        body = {k: v for k, v in (('url', url),
+                                  ('channel_id', channel_id),
+                                  ('team_id', team_id),
+                                  ('submission', submission),
+                                  ('callback_id', callback_id),
+                                  ('state', state),
+                                  ('cancelled', cancelled)) if v is not None}
+
+        return self.request(api_url, request_type='POST', body=body)
@@ -1,13 +1,17 @@
-from typing import Union, List, Dict
 from Mattermost_Base import Base
 
 
+__all__ = ['Opengraph']
+
+
 class Opengraph(Base):
+    __slots__ = ()
+
     def __init__(self, token: str, server_url: str):
         super().__init__(token, server_url)
-        self.api_url = f"{self.base_url}/opengraph"
+        self.api_url = self._make_api_url('/opengraph')
 
-    def get_og_mdata_for_url(self) -> dict:
+    def get_og_mdata_for_url(self, url: str) -> dict:
         """
         Get Open Graph Metadata for a specif URL.
         Use the Open Graph protocol to get some generic metadata about a URL.
@@ -20,10 +24,6 @@ class Opengraph(Base):
         :return: Open Graph retrieval.
         """
 
-        url = f"{self.api_url}/"
-
-        self.reset()
-        self.add_application_json_header()
-        self.add_to_json('url', url)
+        api_url = f"{self.api_url}/"
 
-        return self.request(url, request_type='POST', body=True)
+        return self.request(api_url, request_type='POST', body={'url': url})
@@ -1,12 +1,17 @@
-from typing import Union, List, Dict
-from Mattermost_Base import Base
+from Mattermost_Base import Base, cached_get
+
+
+__all__ = ['Permissions']
 
 
 class Permissions(Base):
+    __slots__ = ()
+
     def __init__(self, token: str, server_url: str):
         super().__init__(token, server_url)
-        self.api_url = f"{self.base_url}/permissions"
+        self.api_url = self._make_api_url('/permissions')
 
+    @cached_get(ttl=300)
     def return_sys_console_ancillary_permissions(self) -> dict:
         """
         Returns all the ancillary permissions for the corresponding system console subsection
@@ -17,6 +22,5 @@ class Permissions(Base):
         """
 
         url = f"{self.api_url}/ancillary"
-        self.reset()
 
         return self.request(url, request_type='GET')
@@ -1,11 +1,45 @@
-from typing import Union, List, Dict
-from Mattermost_Base import Base
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from Mattermost_Base import Base, cached_get, check_id
+
+# Valid values for get_thread's direction, checked client-side so a bad
+# call fails immediately instead of after a server round trip. Set
+# MM_API_SKIP_VALIDATION to defer to raw server behavior.
+_THREAD_DIRECTIONS = frozenset(("up", "down"))
+_SKIP_VALIDATION = bool(os.environ.get('MM_API_SKIP_VALIDATION'))
+
+
+__all__ = ['Posts']
 
 
 class Posts(Base):
+    __slots__ = ()
+
     def __init__(self, token: str, server_url: str):
         super().__init__(token, server_url)
-        self.api_url = f"{self.base_url}/posts"
+        self.api_url = self._make_api_url('/posts')
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _post_url(api_url: str, post_id: str) -> str:
+        """
+        Build the URL of a single post, memoized so repeated calls
+        for the same post skip the string formatting.
+
+        Post IDs are validated against the precompiled 26-character id
+        pattern (unless MM_API_SKIP_VALIDATION is set), so typos fail
+        here instead of after a server round trip; the check result is
+        memoized along with the URL.
+
+        :param api_url: The posts API URL prefix.
+        :param post_id: ID of the post.
+        :return: The post URL.
+        """
+        if not _SKIP_VALIDATION:
+            check_id(post_id)
+        return f"{api_url}/{post_id}"
 
     def create_post(self,
                     channel_id: str,
@@ -14,7 +48,8 @@ class Posts(Base):
                     root_id: str = None,
                     file_ids: list[str] = None,
                     props: dict = None,
-                    metadata: dict = None) -> dict:
+                    metadata: dict = None,
+                    raw_body: bytes = None) -> dict:
         """
         Create a new post in a channel. To create the post as a comment on another post,
         provide root_id.
@@ -29,26 +64,27 @@ class Posts(Base):
         Note that posts are limited to 5 files maximum. Please use additional posts for more files.
         :param props: A general JSON property bag to attach to the post
         :param metadata: A JSON object to add post metadata, e.g the post's priority
+        :param raw_body: A pre-serialized post object as JSON bytes; sent
+        as-is, skipping serialization, and the other body parameters are
+        ignored. The caller owns its validity.
         :return: Post creation info.
         """
 
         url = f"{self.api_url}"
-        self.reset()
-        self.add_application_json_header()
-        self.add_to_json('channel_id', channel_id)
-        self.add_to_json('message', message)
-        if set_online is not None:
-            self.add_to_json('set_online', set_online)
-        if root_id is not None:
-            self.add_to_json('root_id', root_id)
+        if raw_body is not None:
+            return self.request(url, request_type='POST',
+                                raw_body=raw_body)
         if file_ids is not None:
-            self.add_to_json('file_ids', file_ids)
-        if props is not None:
-            self.add_to_json('props', props)
-        if metadata is not None:
-            self.add_to_json('metadata', metadata)
+            file_ids = tuple(file_ids)
+        body = {k: v for k, v in (('channel_id', channel_id),
+                                  ('message', message),
+                                  ('set_online', set_online),
+                                  ('root_id', root_id),
+                                  ('file_ids', file_ids),
+                                  ('props', props),
+                                  ('metadata', metadata)) if v is not None}
 
-        return self.request(url, request_type='POST', body=True)
+        return self.request(url, request_type='POST', body=body)
 
     def create_ephemeral_post(self,
                               user_id: str,
@@ -64,13 +100,11 @@ class Posts(Base):
         """
 
         url = f"{self.api_url}/ephemeral"
-        self.reset()
-        self.add_application_json_header()
-        self.add_to_json('user_id', user_id)
-        self.add_to_json('post', post)
+        body = {'user_id': user_id, 'post': post}
 
-        return self.request(url, request_type='POST', body=True)
+        return self.request(url, request_type='POST', body=body)
 
+    @cached_get(ttl=60)
     def get_post(self,
                  post_id: str,
                  include_deleted: bool = None) -> dict:
@@ -86,13 +120,11 @@ class Posts(Base):
         :return: Post retrieval info.
         """
 
-        url = f"{self.api_url}/{post_id}"
-        self.reset()
-        self.add_application_json_header()
-        if include_deleted is not None:
-            self.add_to_json('include_deleted', include_deleted)
+        url = self._post_url(self.api_url, post_id)
+        params = {k: v for k, v in (('include_deleted', include_deleted),)
+                  if v is not None}
 
-        return self.request(url, request_type='GET', body=True)
+        return self.request(url, request_type='GET', params=params)
 
     def delete_post(self, post_id: str) -> dict:
         """
@@ -105,10 +137,10 @@ class Posts(Base):
         :return: Post deletion info.
         """
 
-        url = f"{self.api_url}/{post_id}"
-        self.reset()
+        url = self._post_url(self.api_url, post_id)
+        self.invalidate('get_')
 
-        return self.request(url, request_type='DEL')
+        return self._request_nobody(url, 'DEL')
 
     def update_post(self,
                     post_id: str,
@@ -132,20 +164,15 @@ class Posts(Base):
         :return: Post update info.
         """
 
-        url = f"{self.api_url}/{post_id}"
-        self.reset()
-        self.add_application_json_header()
-        self.add_to_json('id', id)
-        if is_pinned is not None:
-            self.add_to_json('is_pinned', is_pinned)
-        if message is not None:
-            self.add_to_json('message', message)
-        if has_reactions is not None:
-            self.add_to_json('has_reactions', has_reactions)
-        if props is not None:
-            self.add_to_json('props', props)
+        url = self._post_url(self.api_url, post_id)
+        body = {k: v for k, v in (('id', id),
+                                  ('is_pinned', is_pinned),
+                                  ('message', message),
+                                  ('has_reactions', has_reactions),
+                                  ('props', props)) if v is not None}
+        self.invalidate('get_')
 
-        return self.request(url, request_type='PUT', body=True)
+        return self.request(url, request_type='PUT', body=body)
 
     def mark_as_unread_from_post(self,
                                  user_id: str,
@@ -163,9 +190,8 @@ class Posts(Base):
         """
 
         url = f"{self.base_url}/users/{user_id}/posts/{post_id}/set_unread"
-        self.reset()
 
-        return self.request(url, request_type='POST')
+        return self._request_nobody(url, 'POST')
 
     def patch_post(self,
                    post_id: str,
@@ -191,20 +217,16 @@ class Posts(Base):
         """
 
         url = f"{self.api_url}/{post_id}/patch"
-        self.reset()
-        self.add_application_json_header()
-        if is_pinned is not None:
-            self.add_to_json('is_pinned', is_pinned)
-        if message is not None:
-            self.add_to_json('message', message)
         if file_ids is not None:
-            self.add_to_json('file_ids', file_ids)
-        if has_reactions is not None:
-            self.add_to_json('has_reactions', has_reactions)
-        if props is not None:
-            self.add_to_json('props', props)
+            file_ids = tuple(file_ids)
+        body = {k: v for k, v in (('is_pinned', is_pinned),
+                                  ('message', message),
+                                  ('file_ids', file_ids),
+                                  ('has_reactions', has_reactions),
+                                  ('props', props)) if v is not None}
+        self.invalidate('get_')
 
-        return self.request(url, request_type='PUT', body=True)
+        return self.request(url, request_type='PUT', body=body)
 
     def get_thread(self,
                    post_id: str,
@@ -232,25 +254,23 @@ class Posts(Base):
         :return: Post list retrieval info.
         """
 
+        if (direction is not None and not _SKIP_VALIDATION
+                and direction not in _THREAD_DIRECTIONS):
+            raise ValueError(f"direction must be 'up' or 'down', "
+                             f"got {direction!r}")
+
         url = f"{self.api_url}/{post_id}/thread"
-        self.reset()
-        self.add_application_json_header()
-        if perPage is not None:
-            self.add_to_json('perPage', perPage)
-        if fromPost is not None:
-            self.add_to_json('fromPost', fromPost)
-        if fromCreateAt is not None:
-            self.add_to_json('fromCreateAt', fromCreateAt)
-        if direction is not None:
-            self.add_to_json('direction', direction)
-        if skipFetchThreads is not None:
-            self.add_to_json('skipFetchThreads', skipFetchThreads)
-        if collapsedThreads is not None:
-            self.add_to_json('collapsedThreads', collapsedThreads)
-        if collapsedThreadsExtended is not None:
-            self.add_to_json('collapsedThreadsExtended', collapsedThreadsExtended)
-
-        return self.request(url, request_type='GET', body=True)
+        params = {k: v for k, v in (('perPage', perPage),
+                                    ('fromPost', fromPost),
+                                    ('fromCreateAt', fromCreateAt),
+                                    ('direction', direction),
+                                    ('skipFetchThreads', skipFetchThreads),
+                                    ('collapsedThreads', collapsedThreads),
+                                    ('collapsedThreadsExtended',
+                                     collapsedThreadsExtended))
+                  if v is not None}
+
+        return self.request(url, request_type='GET', params=params)
 
     def get_list_of_flagged_posts(self,
                                   user_id: str,
@@ -274,19 +294,14 @@ class Posts(Base):
 
         url = f"{self.base_url}/users/{user_id}/posts/flagged"
 
-        self.reset()
-        self.add_application_json_header()
-        if team_id is not None:
-            self.add_to_json('team_id', team_id)
-        if channel_id is not None:
-            self.add_to_json('channel_id', channel_id)
-        if page is not None:
-            self.add_to_json('page', page)
-        if per_page is not None:
-            self.add_to_json('per_page', per_page)
+        params = {k: v for k, v in (('team_id', team_id),
+                                    ('channel_id', channel_id),
+                                    ('page', page),
+                                    ('per_page', per_page)) if v is not None}
 
-        return self.request(url, request_type='GET', body=True)
+        return self.request(url, request_type='GET', params=params)
 
+    @cached_get(ttl=60)
     def get_file_info_for_post(self,
                                post_id: str,
                                include_deleted: bool = None) -> dict:
@@ -302,12 +317,10 @@ class Posts(Base):
 
         url = f"{self.api_url}/{post_id}/files/info"
 
-        self.reset()
-        self.add_application_json_header()
-        if include_deleted is not None:
-            self.add_to_json('include_deleted', include_deleted)
+        params = {k: v for k, v in (('include_deleted', include_deleted),)
+                  if v is not None}
 
-        return self.request(url, request_type='GET', body=True)
+        return self.request(url, request_type='GET', params=params)
 
     def get_posts_for_channel(self,
                               channel_id: str,
@@ -338,22 +351,51 @@ class Posts(Base):
 
         url = f"{self.base_url}/channels/{channel_id}/posts"
 
-        self.reset()
-        self.add_application_json_header()
-        if page is not None:
-            self.add_to_json('page', page)
-        if per_page is not None:
-            self.add_to_json('per_page', per_page)
-        if since is not None:
-            self.add_to_json('since', since)
-        if before is not None:
-            self.add_to_json('before', before)
-        if after is not None:
-            self.add_to_json('after', after)
-        if include_deleted is not None:
-            self.add_to_json('include_deleted', include_deleted)
-
-        return self.request(url, request_type='GET', body=True)
+        params = {k: v for k, v in (('page', page),
+                                    ('per_page', per_page),
+                                    ('since', since),
+                                    ('before', before),
+                                    ('after', after),
+                                    ('include_deleted', include_deleted))
+                  if v is not None}
+
+        return self.request(url, request_type='GET', params=params)
+
+    def iter_posts_for_channel(self,
+                               channel_id: str,
+                               per_page: int = 200):
+        """
+        Iterate over all posts in a channel lazily, one page at a time.
+        Each page is fetched on demand and its posts are yielded in the
+        channel's order, so peak memory stays O(per_page) instead of
+        O(total) however long the channel history is. The batch
+        get_posts_for_channel stays unchanged for callers that want a
+        single page dict.
+
+        Must have read_channel permission for the channel.
+
+        :param channel_id: The channel ID to get the posts for.
+        :param per_page: The number of posts per fetched page.
+        :return: A generator of post dicts.
+        """
+
+        page = 0
+        while True:
+            response = self.get_posts_for_channel(channel_id,
+                                                  page=page,
+                                                  per_page=per_page)
+            order = response.get('order') if isinstance(response, dict) \
+                else None
+            if not order:
+                return
+            posts = response.get('posts', {})
+            for post_id in order:
+                post = posts.get(post_id)
+                if post is not None:
+                    yield post
+            if len(order) < per_page:
+                return
+            page += 1
 
     def get_posts_around_oldest_unread(self,
                                        user_id: str,
@@ -387,20 +429,15 @@ class Posts(Base):
 
         url = f"{self.base_url}/users/{user_id}/channels/{channel_id}/posts/unread"
 
-        self.reset()
-        self.add_application_json_header()
-        if limit_before is not None:
-            self.add_to_json('limit_before', limit_before)
-        if limit_after is not None:
-            self.add_to_json('limit_after', limit_after)
-        if skipFetchThreads is not None:
-            self.add_to_json('skipFetchThreads', skipFetchThreads)
-        if collapsedThreads is not None:
-            self.add_to_json('collapsedThreads', collapsedThreads)
-        if collapsedThreadsExtended is not None:
-            self.add_to_json('collapsedThreadsExtended', collapsedThreadsExtended)
-
-        return self.request(url, request_type='GET', body=True)
+        params = {k: v for k, v in (('limit_before', limit_before),
+                                    ('limit_after', limit_after),
+                                    ('skipFetchThreads', skipFetchThreads),
+                                    ('collapsedThreads', collapsedThreads),
+                                    ('collapsedThreadsExtended',
+                                     collapsedThreadsExtended))
+                  if v is not None}
+
+        return self.request(url, request_type='GET', params=params)
 
     def search_for_team_posts(self,
                               team_id: str,
@@ -432,20 +469,15 @@ class Posts(Base):
 
         url = f"{self.base_url}/teams/{team_id}/posts/search"
 
-        self.reset()
-        self.add_application_json_header()
-        self.add_to_json('terms', terms)
-        self.add_to_json('is_or_search', is_or_search)
-        if time_zone_offset is not None:
-            self.add_to_json('time_zone_offset', time_zone_offset)
-        if include_deleted_channels is not None:
-            self.add_to_json('include_deleted_channels', include_deleted_channels)
-        if page is not None:
-            self.add_to_json('page', page)
-        if per_page is not None:
-            self.add_to_json('per_page', per_page)
-
-        return self.request(url, request_type='POST', body=True)
+        body = {k: v for k, v in (('terms', terms),
+                                  ('is_or_search', is_or_search),
+                                  ('time_zone_offset', time_zone_offset),
+                                  ('include_deleted_channels',
+                                   include_deleted_channels),
+                                  ('page', page),
+                                  ('per_page', per_page)) if v is not None}
+
+        return self.request(url, request_type='POST', body=body)
 
     def pin_post_to_channel(self, post_id: str) -> dict:
         """
@@ -458,9 +490,8 @@ class Posts(Base):
         """
 
         url = f"{self.api_url}/{post_id}/pin"
-        self.reset()
 
-        return self.request(url, request_type='POST')
+        return self._request_nobody(url, 'POST')
 
     def unpin_post_to_channel(self, post_id: str) -> dict:
         """
@@ -473,9 +504,8 @@ class Posts(Base):
         """
 
         url = f"{self.api_url}/{post_id}/unpin"
-        self.reset()
 
-        return self.request(url, request_type='POST')
+        return self._request_nobody(url, 'POST')
 
     def perform_post_action(self,
                             post_id: str,
@@ -491,9 +521,8 @@ class Posts(Base):
         """
 
         url = f"{self.api_url}/{post_id}/actions/{action_id}"
-        self.reset()
 
-        return self.request(url, request_type='POST')
+        return self._request_nobody(url, 'POST')
 
     def get_posts_by_list_of_ids(self, post_ids: list[str] = None) -> dict:
         """
@@ -507,12 +536,52 @@ class Posts(Base):
         """
 
         url = f"{self.api_url}/ids"
-        self.reset()
-        self.add_application_json_header()
-        if post_ids is not None:
-            self.add_to_json('post_ids', post_ids)
 
-        return self.request(url, request_type='POST')
+        # The bare array goes straight to orjson, which serializes a
+        # homogeneous list of strings in one C loop; no tuple() copy of
+        # a potentially huge id list.
+        return self.request(url, request_type='POST',
+                            body=post_ids if post_ids else ())
+
+    def get_posts_many(self,
+                       post_ids: list[str],
+                       chunk_size: int = 200,
+                       max_workers: int = 8) -> list:
+        """
+        Fetch many posts by ID through the bulk /ids endpoint instead of
+        one get_post round trip per ID. IDs are sent in chunks of
+        chunk_size, and the chunk requests run on a bounded thread pool
+        over the shared connection pool, so total latency approaches the
+        slowest chunk rather than the sum of all chunks.
+
+        Must have read_channel permission for the channel the post is in or if the channel is public,
+        have the read_public_channels permission for the team.
+
+        :param post_ids: List of post ids
+        :param chunk_size: The number of IDs per bulk request.
+        :param max_workers: The number of chunk requests in flight at once.
+        :return: The fetched posts, flattened across chunks in input order.
+        """
+
+        ids = list(post_ids)
+        chunks = [ids[start:start + chunk_size]
+                  for start in range(0, len(ids), chunk_size)]
+
+        if len(chunks) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                responses = list(pool.map(self.get_posts_by_list_of_ids,
+                                          chunks))
+        else:
+            responses = [self.get_posts_by_list_of_ids(chunk)
+                         for chunk in chunks]
+
+        posts = []
+        for response in responses:
+            if isinstance(response, list):
+                posts.extend(response)
+            elif response:
+                posts.append(response)
+        return posts
 
     def set_post_reminder(self,
                           user_id: str,
@@ -532,11 +601,9 @@ class Posts(Base):
         """
 
         url = f"{self.base_url}/users/{user_id}/posts/{post_id}/reminder"
-        self.reset()
-        self.add_application_json_header()
-        self.add_to_json('target_time', target_time)
+        body = {'target_time': target_time}
 
-        return self.request(url, request_type='POST', body=True)
+        return self.request(url, request_type='POST', body=body)
 
     def acknowledge_post(self,
                          user_id: str,
@@ -555,9 +622,8 @@ class Posts(Base):
         """
 
         url = f"{self.base_url}/users/{user_id}/posts/{post_id}/ack"
-        self.reset()
 
-        return self.request(url, request_type='POST')
+        return self._request_nobody(url, 'POST')
 
     def delete_post_acknowledgement(self,
                                     user_id: str,
@@ -577,6 +643,5 @@ class Posts(Base):
         """
 
         url = f"{self.base_url}/users/{user_id}/posts/{post_id}/ack"
-        self.reset()
 
-        return self.request(url, request_type='DEL')
+        return self._request_nobody(url, 'DEL')
@@ -0,0 +1,269 @@
+import asyncio
+
+from Mattermost_Async_Base import AsyncBase
+
+
+__all__ = ['AsyncPosts']
+
+
+class AsyncPosts(AsyncBase):
+    __slots__ = ()
+
+    def __init__(self, token: str, server_url: str):
+        super().__init__(token, server_url)
+        self.api_url = f"{self.base_url}/posts"
+
+    async def acreate_post(self,
+                           channel_id: str,
+                           message: str,
+                           set_online: bool = None,
+                           root_id: str = None,
+                           file_ids: list[str] = None,
+                           props: dict = None,
+                           metadata: dict = None) -> dict:
+        """
+        Create a new post in a channel, asynchronously.
+        Mirrors Posts.create_post; many independent calls can be
+        overlapped with asyncio.gather.
+
+        Must have create_post permission for the channel the post is being created in.
+
+        :param channel_id: The channel ID to post in.
+        :param message: The message contents, can be formatted with Markdown.
+        :param set_online: Whether to set the user status as online or not.
+        :param root_id: The post ID to comment on.
+        :param file_ids: A list of file IDs to associate with the post.
+        :param props: A general JSON property bag to attach to the post
+        :param metadata: A JSON object to add post metadata, e.g the post's priority
+        :return: Post creation info.
+        """
+
+        url = f"{self.api_url}"
+        body = {k: v for k, v in (('channel_id', channel_id),
+                                  ('message', message),
+                                  ('set_online', set_online),
+                                  ('root_id', root_id),
+                                  ('file_ids', file_ids),
+                                  ('props', props),
+                                  ('metadata', metadata)) if v is not None}
+
+        return await self.request(url, request_type='POST', body=body)
+
+    async def acreate_many(self,
+                           posts: list[dict],
+                           concurrency: int = 16) -> list:
+        """
+        Create many posts concurrently. Each item is a dict of
+        acreate_post keyword arguments; at most `concurrency` requests
+        are in flight at once so bulk imports overlap their network
+        waits without flooding the server.
+
+        :param posts: A list of acreate_post keyword argument dicts.
+        :param concurrency: The maximum number of concurrent requests.
+        :return: A list of post creation infos, in input order.
+        Failed items hold the raised exception instead.
+        """
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(post: dict):
+            async with semaphore:
+                return await self.acreate_post(**post)
+
+        return await asyncio.gather(*[one(post) for post in posts],
+                                    return_exceptions=True)
+
+    def create_many(self,
+                    posts: list[dict],
+                    concurrency: int = 16) -> list:
+        """
+        Synchronous wrapper around acreate_many for non-async callers.
+        Runs its own event loop and closes the session afterwards.
+
+        :param posts: A list of acreate_post keyword argument dicts.
+        :param concurrency: The maximum number of concurrent requests.
+        :return: A list of post creation infos, in input order.
+        """
+
+        async def runner():
+            try:
+                return await self.acreate_many(posts, concurrency=concurrency)
+            finally:
+                await self.close()
+
+        return asyncio.run(runner())
+
+    async def aget_posts_for_channel(self,
+                                     channel_id: str,
+                                     page: int = None,
+                                     per_page: int = None) -> dict:
+        """
+        Get a page of posts in a channel, asynchronously.
+        Mirrors Posts.get_posts_for_channel.
+
+        Must have read_channel permission for the channel.
+
+        :param channel_id: The channel ID to get the posts for.
+        :param page: Default: 0. The page to select.
+        :param per_page: Default: 60. The number of posts per page.
+        :return: Post list retrieval info.
+        """
+
+        url = f"{self.base_url}/channels/{channel_id}/posts"
+        params = {k: v for k, v in (('page', page),
+                                    ('per_page', per_page)) if v is not None}
+
+        return await self.request(url, request_type='GET', params=params)
+
+    async def aget_all_posts_for_channel(self,
+                                         channel_id: str,
+                                         per_page: int = 200,
+                                         concurrency: int = 8) -> list:
+        """
+        Walk every page of a channel's posts, fetching `concurrency`
+        pages at a time with asyncio.gather and stopping at the first
+        short or empty page, so a full walk costs ~pages/concurrency
+        round trips instead of one per page.
+
+        :param channel_id: The channel ID to get the posts for.
+        :param per_page: The number of posts per page.
+        :param concurrency: The number of pages fetched concurrently.
+        :return: A list of page responses in page order.
+        """
+
+        pages = []
+        page = 0
+        while True:
+            batch = await asyncio.gather(
+                *[self.aget_posts_for_channel(channel_id, page=p,
+                                              per_page=per_page)
+                  for p in range(page, page + concurrency)])
+            done = False
+            for chunk in batch:
+                order = chunk.get('order') if isinstance(chunk, dict) else chunk
+                if not order:
+                    done = True
+                    break
+                pages.append(chunk)
+                if len(order) < per_page:
+                    done = True
+                    break
+            if done:
+                return pages
+            page += concurrency
+
+    def get_all_posts_for_channel(self,
+                                  channel_id: str,
+                                  per_page: int = 200,
+                                  concurrency: int = 8) -> list:
+        """
+        Synchronous wrapper around aget_all_posts_for_channel for
+        non-async callers. Runs its own event loop and closes the
+        session afterwards.
+
+        :param channel_id: The channel ID to get the posts for.
+        :param per_page: The number of posts per page.
+        :param concurrency: The number of pages fetched concurrently.
+        :return: A list of page responses in page order.
+        """
+
+        async def runner():
+            try:
+                return await self.aget_all_posts_for_channel(
+                    channel_id, per_page=per_page, concurrency=concurrency)
+            finally:
+                await self.close()
+
+        return asyncio.run(runner())
+
+    async def aget_post(self,
+                        post_id: str,
+                        include_deleted: bool = None) -> dict:
+        """
+        Get a single post, asynchronously. Mirrors Posts.get_post.
+
+        Must have read_channel permission for the channel the post is in or if the channel is public,
+        have the read_public_channels permission for the team.
+
+        :param post_id: ID of the post to get.
+        :param include_deleted: Default: false. Defines if result should
+        include deleted posts, must have 'manage_system' (admin) permission.
+        :return: Post retrieval info.
+        """
+
+        url = f"{self.api_url}/{post_id}"
+        params = {k: v for k, v in (('include_deleted', include_deleted),)
+                  if v is not None}
+
+        return await self.request(url, request_type='GET', params=params)
+
+    async def aget_posts_bulk(self,
+                              post_ids: list[str],
+                              concurrency: int = 32) -> list:
+        """
+        Fetch many posts by ID concurrently under a bounded semaphore,
+        so a 500-ID fetch costs roughly ceil(500/concurrency) round
+        trips of latency instead of 500, while the cap keeps the server
+        from being flooded.
+
+        Must have read_channel permission for the channel the post is in or if the channel is public,
+        have the read_public_channels permission for the team.
+
+        :param post_ids: The IDs of the posts to fetch.
+        :param concurrency: The number of requests in flight at once.
+        :return: The fetched posts, in input order.
+        """
+
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(post_id: str):
+            async with sem:
+                return await self.aget_post(post_id)
+
+        return await asyncio.gather(*[one(post_id)
+                                      for post_id in post_ids])
+
+    async def aupdate_post(self,
+                           post_id: str,
+                           id: str,
+                           is_pinned: bool = None,
+                           message: str = None,
+                           has_reactions: bool = None,
+                           props: str = None) -> dict:
+        """
+        Update a post, asynchronously. Mirrors Posts.update_post.
+
+        Must have edit_post permission for the channel the post is in.
+
+        :param post_id: ID of the post to update.
+        :param id: ID of the post to update.
+        :param is_pinned: Set to true to pin the post to the channel it is in.
+        :param message: The message text of the post.
+        :param has_reactions: Set to true if the post has reactions to it.
+        :param props: A general JSON property bag to attach to the post.
+        :return: Post update info.
+        """
+
+        url = f"{self.api_url}/{post_id}"
+        body = {k: v for k, v in (('id', id),
+                                  ('is_pinned', is_pinned),
+                                  ('message', message),
+                                  ('has_reactions', has_reactions),
+                                  ('props', props)) if v is not None}
+
+        return await self.request(url, request_type='PUT', body=body)
+
+    async def adelete_post(self, post_id: str) -> dict:
+        """
+        Soft deletes a post, asynchronously. Mirrors Posts.delete_post;
+        bulk deletions can be overlapped with asyncio.gather.
+
+        Must be logged in as the user or have delete_others_posts permission.
+
+        :param post_id: ID of the post to delete.
+        :return: Post deletion info.
+        """
+
+        url = f"{self.api_url}/{post_id}"
+
+        return await self.request(url, request_type='DELETE')
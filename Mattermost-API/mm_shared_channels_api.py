@@ -1,16 +1,22 @@
-from typing import Union, List, Dict
-from Mattermost_Base import Base
+from Mattermost_Base import Base, make_call
+
+
+__all__ = ['SharedChannels']
 
 
 class SharedChannels(Base):
+    __slots__ = ()
+
     def __init__(self, token: str, server_url: str):
         super().__init__(token, server_url)
-        self.api_url = f"{self.base_url}/sharedchannels"
-
-    def get_shrd_chnls_for_team(self, team_id: str,
-                                page: int = None,
-                                per_page: int = None) -> dict:
-        """
+        self.api_url = self._make_api_url('/sharedchannels')
+
+    get_shrd_chnls_for_team = make_call(
+        'GET', '/{team_id}',
+        path_params=('team_id',),
+        optional=('page', 'per_page'),
+        send='params',
+        doc="""
         Get all shared channels for a team.
 
         Minimum server version: 5.50
@@ -20,20 +26,12 @@ class SharedChannels(Base):
         :param page: Default: 0. The page to select.
         :param per_page: Default: 0. The number of sharedchannels per page.
         :return: Shared channels info.
-        """
+        """)
 
-        url = f"{self.api_url}/{team_id}"
-        self.reset()
-        self.add_application_json_header()
-        if page is not None:
-            self.add_to_json('page', page)
-        if per_page is not None:
-            self.add_to_json('per_page', per_page)
-
-        return self.request(url, request_type='GET', body=True)
-
-    def get_remote_clstr_info_by_id(self, remote_id: str) -> dict:
-        """
+    get_remote_clstr_info_by_id = make_call(
+        'GET', '/{remote_id}',
+        path_params=('remote_id',),
+        doc="""
         Get remote cluster info based on remoteId.
 
         Minimum server version: 5.50
@@ -42,9 +40,4 @@ class SharedChannels(Base):
 
         :param remote_id: Remote Cluster GUID.
         :return: Remote cluster info.
-        """
-
-        url = f"{self.api_url}/{remote_id}"
-        self.reset()
-
-        return self.request(url, request_type='GET')
+        """)
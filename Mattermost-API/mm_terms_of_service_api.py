@@ -1,11 +1,15 @@
-from typing import Union, List, Dict
-from Mattermost_Base import Base
+from Mattermost_Base import Base, cached_get
+
+
+__all__ = ['TermsOfService']
 
 
 class TermsOfService(Base):
+    __slots__ = ()
+
     def __init__(self, token: str, server_url: str):
         super().__init__(token, server_url)
-        self.api_url = f"{self.base_url}/users/"
+        self.api_url = self._make_api_url('/users/')
 
     def records_user_action_custom_terms(self, user_id: str,
                                          serviceTermsId: str,
@@ -25,13 +29,11 @@ class TermsOfService(Base):
 
         url = f"{self.api_url}/{user_id}/terms_of_service"
 
-        self.reset()
-        self.add_application_json_header()
-        self.add_to_json('user_id', user_id)
-        self.add_to_json('serviceTermsId', serviceTermsId)
-        self.add_to_json('accepted', accepted)
+        body = {'user_id': user_id,
+                'serviceTermsId': serviceTermsId,
+                'accepted': accepted}
 
-        return self.request(url, request_type='POST', body=True)
+        return self.request(url, request_type='POST', body=body)
 
     def fetches_user_terms_of_service_action(self, user_id: str) -> dict:
         """
@@ -46,12 +48,9 @@ class TermsOfService(Base):
 
         url = f"{self.api_url}/{user_id}/terms_of_service"
 
-        self.reset()
-        self.add_application_json_header()
-        self.add_to_json('user_id', user_id)
-
         return self.request(url, request_type='GET')
 
+    @cached_get(ttl=300)
     def get_latest_terms_of_service(self) -> dict:
         """
         Get latest terms of service from the server
@@ -63,8 +62,6 @@ class TermsOfService(Base):
 
         url = f"{self.api_url}/terms_of_service"
 
-        self.reset()
-
         return self.request(url, request_type='GET')
 
     def creates_new_terms_of_service(self) -> dict:
@@ -77,7 +74,6 @@ class TermsOfService(Base):
         """
 
         url = f"{self.api_url}/terms_of_service"
+        self.invalidate('get_')
 
-        self.reset()
-
-        return self.request(url, request_type='POST')
+        return self._request_nobody(url, 'POST')
@@ -1,11 +1,23 @@
-from typing import Union, List, Dict
 from Mattermost_Base import Base
 
+_PATH_THREADS = "/%s/teams/%s/threads"
+_PATH_MENTION_COUNTS = "/%s/teams/%s/threads/mention_counts"
+_PATH_READ_ALL = "/%s/teams/%s/threads/read"
+_PATH_THREAD = "/%s/teams/%s/threads/%s"
+_PATH_THREAD_READ = "/%s/teams/%s/threads/%s/read/%s"
+_PATH_SET_UNREAD = "/%s/teams/%s/threads/%s/set_unread/%s"
+_PATH_FOLLOWING = "/%s/teams/%s/threads/%s/following"
+
+
+__all__ = ['Threads']
+
 
 class Threads(Base):
+    __slots__ = ()
+
     def __init__(self, token: str, server_url: str):
         super().__init__(token, server_url)
-        self.api_url = f"{self.base_url}/users"
+        self.api_url = self._make_api_url('/users')
 
     def get_threads_user_is_following(self,
                                       user_id: str,
@@ -35,26 +47,18 @@ class Threads(Base):
         :return: User's threads retrieval info.
         """
 
-        url = f"{self.api_url}/{user_id}/teams/{team_id}/threads"
-
-        self.reset()
-        self.add_application_json_header()
-        if since is not None:
-            self.add_to_json('since', since)
-        if deleted is not None:
-            self.add_to_json('deleted', deleted)
-        if extended is not None:
-            self.add_to_json('extended', extended)
-        if page is not None:
-            self.add_to_json('page', page)
-        if pageSize is not None:
-            self.add_to_json('pageSize', pageSize)
-        if totalsOnly is not None:
-            self.add_to_json('totalsOnly', totalsOnly)
-        if threadsOnly is not None:
-            self.add_to_json('threadsOnly', threadsOnly)
-
-        return self.request(url, request_type='GET', body=True)
+        url = self.api_url + _PATH_THREADS % (user_id, team_id)
+
+        params = {k: v for k, v in (('since', since),
+                                    ('deleted', deleted),
+                                    ('extended', extended),
+                                    ('page', page),
+                                    ('pageSize', pageSize),
+                                    ('totalsOnly', totalsOnly),
+                                    ('threadsOnly', threadsOnly))
+                  if v is not None}
+
+        return self.request(url, request_type='GET', params=params)
                                           
     def get_unread_mention_counts_from_followed_threads(self,
                                                         user_id: str,
@@ -70,9 +74,7 @@ class Threads(Base):
         :return: Get process info.
         """
 
-        url = f"{self.api_url}/{user_id}/teams/{team_id}/threads/mention_counts"
-
-        self.reset()
+        url = self.api_url + _PATH_MENTION_COUNTS % (user_id, team_id)
 
         return self.request(url, request_type='GET')
 
@@ -90,11 +92,9 @@ class Threads(Base):
         :return: User's threads update info.
         """
 
-        url = f"{self.api_url}/{user_id}/teams/{team_id}/threads/read"
+        url = self.api_url + _PATH_READ_ALL % (user_id, team_id)
 
-        self.reset()
-
-        return self.request(url, request_type='PUT')
+        return self._request_nobody(url, 'PUT')
 
     def mark_thread_that_user_following_read_state_to_the_timestamp(self,
                                                                     user_id: str,
@@ -114,11 +114,9 @@ class Threads(Base):
         :return: User's threads update info.
         """
 
-        url = f"{self.api_url}/{user_id}/teams/{team_id}/threads/{thread_id}/read/{timestamp}"
-
-        self.reset()
+        url = self.api_url + _PATH_THREAD_READ % (user_id, team_id, thread_id, timestamp)
 
-        return self.request(url, request_type='PUT')
+        return self._request_nobody(url, 'PUT')
 
     def mark_thread_that_user_following_as_read_based_on_post_id(self,
                                                                  user_id: str,
@@ -140,11 +138,9 @@ class Threads(Base):
         :return: User's thread update info.
         """
 
-        url = f"{self.api_url}/{user_id}/teams/{team_id}/threads/{thread_id}/set_unread/{post_id}"
-
-        self.reset()
+        url = self.api_url + _PATH_SET_UNREAD % (user_id, team_id, thread_id, post_id)
 
-        return self.request(url, request_type='POST')
+        return self._request_nobody(url, 'POST')
 
     def start_following_thread(self,
                                user_id: str,
@@ -162,11 +158,9 @@ class Threads(Base):
         :return: User's thread update info.
         """
 
-        url = f"{self.api_url}/{user_id}/teams/{team_id}/threads/{thread_id}/following"
+        url = self.api_url + _PATH_FOLLOWING % (user_id, team_id, thread_id)
 
-        self.reset()
-
-        return self.request(url, request_type='PUT')
+        return self._request_nobody(url, 'PUT')
 
     def stop_following_thread(self,
                               user_id: str,
@@ -184,11 +178,9 @@ class Threads(Base):
         :return: User's thread update info.
         """
 
-        url = f"{self.api_url}/{user_id}/teams/{team_id}/threads/{thread_id}/following"
-
-        self.reset()
+        url = self.api_url + _PATH_FOLLOWING % (user_id, team_id, thread_id)
 
-        return self.request(url, request_type='DEL')
+        return self._request_nobody(url, 'DEL')
 
     def get_thread_followed_by_user(self,
                                     user_id: str,
@@ -206,8 +198,6 @@ class Threads(Base):
         :return: User's thread update info.
         """
 
-        url = f"{self.api_url}/{user_id}/teams/{team_id}/threads/{thread_id}"
-
-        self.reset()
+        url = self.api_url + _PATH_THREAD % (user_id, team_id, thread_id)
 
         return self.request(url, request_type='GET')
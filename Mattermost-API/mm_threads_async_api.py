@@ -0,0 +1,114 @@
+import asyncio
+
+from Mattermost_Async_Base import AsyncBase
+
+
+__all__ = ['AsyncThreads']
+
+
+class AsyncThreads(AsyncBase):
+    __slots__ = ()
+
+    def __init__(self, token: str, server_url: str):
+        super().__init__(token, server_url)
+        self.api_url = f"{self.base_url}/users"
+
+    async def aget_threads_user_is_following(self,
+                                             user_id: str,
+                                             team_id: str,
+                                             since: int = None,
+                                             deleted: bool = None,
+                                             extended: bool = None,
+                                             page: int = None,
+                                             pageSize: int = None,
+                                             totalsOnly: bool = None,
+                                             threadsOnly: bool = None) -> dict:
+        """
+        Get all threads that user is following, asynchronously.
+        Mirrors Threads.get_threads_user_is_following.
+
+        Minimum server version: 5.29
+        Must be logged in as the user or have edit_other_users permission.
+
+        :param user_id: The ID of the user. This can also be "me" which will point to the current user.
+        :param team_id: The ID of the team in which the thread is.
+        :param since: Since filters the threads based on their LastUpdateAt timestamp.
+        :param deleted: Default: false. Deleted will specify that even deleted threads should be returned (For mobile sync).
+        :param extended: Default: false. Extended will enrich the response with participant details.
+        :param page: Default: 0. Page specifies which part of the results to return, by PageSize.
+        :param pageSize: Default: 30. PageSize specifies the size of the returned chunk of results.
+        :param totalsOnly: Default: false. Setting this to true will only return the total counts.
+        :param threadsOnly: Default: false. Setting this to true will only return threads.
+        :return: User's threads retrieval info.
+        """
+
+        url = f"{self.api_url}/{user_id}/teams/{team_id}/threads"
+        params = {k: v for k, v in (('since', since),
+                                    ('deleted', deleted),
+                                    ('extended', extended),
+                                    ('page', page),
+                                    ('pageSize', pageSize),
+                                    ('totalsOnly', totalsOnly),
+                                    ('threadsOnly', threadsOnly))
+                  if v is not None}
+
+        return await self.request(url, request_type='GET', params=params)
+
+    async def aget_thread_followed_by_user(self,
+                                           user_id: str,
+                                           team_id: str,
+                                           thread_id: str) -> dict:
+        """
+        Get a thread, asynchronously.
+        Mirrors Threads.get_thread_followed_by_user.
+
+        Minimum server version: 5.29
+        Must be logged in as the user or have edit_other_users permission.
+
+        :param user_id: The ID of the user. This can also be "me" which will point to the current user.
+        :param team_id: The ID of the team in which the thread is.
+        :param thread_id: The ID of the thread to follow.
+        :return: User's thread update info.
+        """
+
+        url = f"{self.api_url}/{user_id}/teams/{team_id}/threads/{thread_id}"
+
+        return await self.request(url, request_type='GET')
+
+    async def abulk_get_threads(self,
+                                user_id: str,
+                                team_ids: list[str]) -> list:
+        """
+        Fetch the followed threads of one user across many teams
+        concurrently, so N independent per-team calls complete in
+        ~max(latency) instead of sum(latency).
+
+        :param user_id: The ID of the user. This can also be "me" which will point to the current user.
+        :param team_ids: The IDs of the teams to fetch threads for.
+        :return: A list of per-team thread retrieval infos, in input order.
+        """
+
+        return await asyncio.gather(
+            *[self.aget_threads_user_is_following(user_id, team_id)
+              for team_id in team_ids])
+
+    def bulk_get_threads(self,
+                         user_id: str,
+                         team_ids: list[str]) -> list:
+        """
+        Sync shim over abulk_get_threads for callers without an event
+        loop: runs the concurrent per-team fetches via asyncio.run and
+        closes the session afterwards.
+
+        :param user_id: The ID of the user. This can also be "me" which will point to the current user.
+        :param team_ids: The IDs of the teams to fetch threads for.
+        :return: A list of per-team thread retrieval infos, in input order.
+        """
+
+        async def run():
+            try:
+                return await self.abulk_get_threads(user_id, team_ids)
+            finally:
+                await self.close()
+
+        return asyncio.run(run())
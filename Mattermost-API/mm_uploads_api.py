@@ -1,11 +1,17 @@
-from typing import Union, List, Dict
+import os
+
 from Mattermost_Base import Base
 
 
+__all__ = ['Uploads']
+
+
 class Uploads(Base):
+    __slots__ = ()
+
     def __init__(self, token: str, server_url: str):
         super().__init__(token, server_url)
-        self.api_url = f"{self.base_url}/uploads"
+        self.api_url = self._make_api_url('/uploads')
 
     def create_upload(self, channel_id: str,
                       filename: str,
@@ -24,13 +30,11 @@ class Uploads(Base):
 
         url = f"{self.api_url}"
 
-        self.reset()
-        self.add_application_json_header()
-        self.add_to_json('channel_id', channel_id)
-        self.add_to_json('filename', filename)
-        self.add_to_json('file_size', file_size)
+        body = {'channel_id': channel_id,
+                'filename': filename,
+                'file_size': file_size}
 
-        return self.request(url, request_type='POST', body=True)
+        return self.request(url, request_type='POST', body=body)
 
     def get_upload_session(self, upload_id: str) -> dict:
         """
@@ -42,8 +46,7 @@ class Uploads(Base):
         :return: Upload session
         """
 
-        url = f"{self.api_url}/{upload_id}"
-        self.reset()
+        url = self.api_url + '/' + upload_id
 
         return self.request(url, request_type='GET')
 
@@ -63,14 +66,15 @@ class Uploads(Base):
         :return: Upload info.
         """
 
-        url = f"{self.api_url}/{upload_id}"
-        self.reset()
-        self.add_application_www_form_header()
+        url = self.api_url + '/' + upload_id
 
         if file_path is not None:
-            self.add_file(file_path=file_path)
+            with open(file_path, 'rb') as f:
+                files = {'files': (os.path.basename(file_path), f,
+                                   'application/octet-stream')}
+                return self.request(url, request_type='POST', files=files)
 
-        return self.request(url, request_type='POST', files=True)
+        return self.request(url, request_type='POST')
 
 
 
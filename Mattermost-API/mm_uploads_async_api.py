@@ -0,0 +1,96 @@
+import asyncio
+
+from Mattermost_Async_Base import AsyncBase
+
+
+__all__ = ['AsyncUploads']
+
+
+class AsyncUploads(AsyncBase):
+    __slots__ = ()
+
+    def __init__(self, token: str, server_url: str):
+        super().__init__(token, server_url)
+        self.api_url = f"{self.base_url}/uploads"
+
+    async def acreate_upload(self,
+                             channel_id: str,
+                             filename: str,
+                             file_size: int) -> dict:
+        """
+        Creates a new upload session, asynchronously.
+        Mirrors Uploads.create_upload.
+
+        Minimum server version: 5.28
+        Must have upload_file permission.
+
+        :param channel_id: The ID of the channel to upload to.
+        :param filename: The name of the file to upload.
+        :param file_size: The size of the file to upload in bytes.
+        :return: Upload creation successful.
+        """
+
+        url = f"{self.api_url}"
+        body = {'channel_id': channel_id,
+                'filename': filename,
+                'file_size': file_size}
+
+        return await self.request(url, request_type='POST', body=body)
+
+    async def aget_upload_session(self, upload_id: str) -> dict:
+        """
+        Gets an upload session that has been previously created,
+        asynchronously. Mirrors Uploads.get_upload_session.
+
+        Must be logged in as the user who created the upload session.
+
+        :param upload_id: The ID of the upload session to get.
+        :return: Upload session
+        """
+
+        url = f"{self.api_url}/{upload_id}"
+
+        return await self.request(url, request_type='GET')
+
+    async def acreate_uploads_bulk(self,
+                                   uploads: list[dict],
+                                   concurrency: int = 16) -> list:
+        """
+        Create many upload sessions concurrently under a bounded
+        semaphore, so preparing a batch of file transfers costs
+        ~ceil(N/concurrency) round trips of latency instead of N.
+
+        :param uploads: A list of acreate_upload keyword argument dicts.
+        :param concurrency: The maximum number of concurrent requests.
+        :return: A list of upload creation infos, in input order.
+        """
+
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(upload: dict):
+            async with sem:
+                return await self.acreate_upload(**upload)
+
+        return await asyncio.gather(*[one(upload) for upload in uploads])
+
+    def create_uploads_bulk(self,
+                            uploads: list[dict],
+                            concurrency: int = 16) -> list:
+        """
+        Sync shim over acreate_uploads_bulk for callers without an
+        event loop: runs the concurrent session creations via
+        asyncio.run and closes the session afterwards.
+
+        :param uploads: A list of acreate_upload keyword argument dicts.
+        :param concurrency: The maximum number of concurrent requests.
+        :return: A list of upload creation infos, in input order.
+        """
+
+        async def run():
+            try:
+                return await self.acreate_uploads_bulk(
+                    uploads, concurrency=concurrency)
+            finally:
+                await self.close()
+
+        return asyncio.run(run())
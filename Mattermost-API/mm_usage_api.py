@@ -1,14 +1,9 @@
-from typing import Union, List, Dict
-from Mattermost_Base import Base
+from Mattermost_Base import Base, endpoints
 
-
-class Usage(Base):
-    def __init__(self, token: str, server_url: str):
-        super().__init__(token, server_url)
-        self.api_url = f"{self.base_url}/usage"
-
-    def get_current_post_usage(self) -> dict:
-        """
+_ENDPOINTS = {
+    'get_current_post_usage': dict(
+        request_type='GET', path='/posts', ttl=60,
+        doc="""
         Retrieve rounded off total no. of posts for this instance.
         Example: returns 4000 instead of 4321
 
@@ -16,16 +11,10 @@ class Usage(Base):
         Minimum server version: 7.0
 
         :return: Total no. of posts returned successfully
-        """
-
-        url = f"{self.api_url}/posts"
-
-        self.reset()
-
-        return self.request(url, request_type='GET')
-
-    def get_total_file_storage_usage(self) -> dict:
-        """
+        """),
+    'get_total_file_storage_usage': dict(
+        request_type='GET', path='/storage', ttl=60,
+        doc="""
         Get the total file storage usage for the instance in bytes
         rounded down to the most significant digit.
         Example: returns 4000 instead of 4321
@@ -34,10 +23,17 @@ class Usage(Base):
         Minimum server version: 7.1
 
         :return: Total file storage usage for the instance in bytes rounded down to the most significant digit
-        """
+        """),
+}
 
-        url = f"{self.api_url}/storage"
 
-        self.reset()
+__all__ = ['Usage']
 
-        return self.request(url, request_type='GET')
+
+@endpoints(_ENDPOINTS)
+class Usage(Base):
+    __slots__ = ()
+
+    def __init__(self, token: str, server_url: str):
+        super().__init__(token, server_url)
+        self.api_url = self._make_api_url('/usage')
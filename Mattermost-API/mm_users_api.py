@@ -0,0 +1,826 @@
+from concurrent.futures import ThreadPoolExecutor
+import os
+import time
+
+import string
+from urllib.parse import quote as _quote
+
+from Mattermost_Base import Base, cached_get
+
+# Незарезервированные символы RFC 3986: такие сегменты пути можно
+# подставлять как есть, не платя за quote() на каждом вызове.
+_UNRESERVED = frozenset(string.ascii_letters + string.digits + '-._~')
+
+
+def _enc(segment: str) -> str:
+    """
+    Percent-encode a user-supplied path segment, skipping the quote
+    call entirely for the common all-unreserved case.
+
+    :param segment: The raw path segment.
+    :return: The segment, percent-encoded if needed.
+    """
+    if segment.isascii() and _UNRESERVED.issuperset(segment):
+        return segment
+    return _quote(segment, safe='')
+
+# Шаблоны путей, собранные один раз при импорте: %-подстановка на
+# горячем пути дешевле повторной f-интерполяции.
+_PATH_USER = '/%s'
+_PATH_PATCH = '/%s/patch'
+_PATH_ROLES = '/%s/roles'
+_PATH_MFA = '/%s/mfa'
+_PATH_SESSIONS = '/%s/sessions'
+_PATH_REVOKE = '/%s/sessions/revoke'
+_PATH_REVOKE_ALL = '/%s/sessions/revoke/all'
+_PATH_AUDITS = '/%s/audits'
+_PATH_IMAGE = '/%s/image'
+
+__all__ = ['Users']
+
+
+class Users(Base):
+    __slots__ = ()
+
+    def __init__(self, token: str, server_url: str):
+        super().__init__(token, server_url)
+        self.api_url = self._make_api_url('/users')
+
+    def login_to_mattermost_server(self,
+                                   login_id: str = None,
+                                   password: str = None,
+                                   token: str = None,
+                                   device_id: str = None,
+                                   ldap_only: bool = None) -> dict:
+        """
+        Login to Mattermost server.
+
+        No permission required.
+
+        :param login_id: The email or username used to login.
+        :param password: The password used to login.
+        :param token: One time token for MFA.
+        :param device_id: Mobile device ID for push notifications.
+        :param ldap_only: If true, user will be authenticated via LDAP only.
+        :return: User login info.
+        """
+
+        url = self.api_url + '/login'
+        body = {k: v for k, v in (('login_id', login_id),
+                                  ('password', password),
+                                  ('token', token),
+                                  ('device_id', device_id),
+                                  ('ldap_only', ldap_only))
+                if v is not None}
+
+        return self.request(url, request_type='POST', body=body)
+
+    def create_user(self,
+                    email: str,
+                    username: str,
+                    t: str = None,
+                    iid: str = None,
+                    first_name: str = None,
+                    last_name: str = None,
+                    nickname: str = None,
+                    auth_data: str = None,
+                    auth_service: str = None,
+                    password: str = None,
+                    locale: str = None,
+                    props: dict = None,
+                    notify_props: dict = None) -> dict:
+        """
+        Create a new user on the system.
+
+        Password is required for email login, while
+        auth_data and auth_service are required for other login types.
+        No permission required for signup with email if signup is enabled.
+
+        :param email: User's email.
+        :param username: User's name.
+        :param t: Token ID from an email invitation.
+        :param iid: Token ID from an invitation link.
+        :param first_name: User's first name.
+        :param last_name: User's last name.
+        :param nickname: User's nickname.
+        :param auth_data: Service-specific authentication data.
+        :param auth_service: The authentication service, one of "email", "gitlab", "ldap", "saml", "office365", "google".
+        :param password: The password used for email authentication.
+        :param locale: User's locale.
+        :param props: User's props.
+        :param notify_props: User's notify props.
+        :return: User creation info.
+        """
+
+        url = f"{self.api_url}"
+        params = {k: v for k, v in (('t', t),
+                                    ('iid', iid)) if v is not None}
+        body = {'email': email, 'username': username}
+        body.update({k: v for k, v in (('first_name', first_name),
+                                       ('last_name', last_name),
+                                       ('nickname', nickname),
+                                       ('auth_data', auth_data),
+                                       ('auth_service', auth_service),
+                                       ('password', password),
+                                       ('locale', locale),
+                                       ('props', props),
+                                       ('notify_props', notify_props))
+                     if v is not None})
+
+        self.invalidate('_miss_')
+        self.invalidate('get_user_by_')
+
+        return self.request(url, request_type='POST',
+                            params=params, body=body)
+
+    def get_users(self,
+                  page: int = None,
+                  per_page: int = None,
+                  in_team: str = None,
+                  not_in_team: str = None,
+                  in_channel: str = None,
+                  not_in_channel: str = None,
+                  in_group: str = None,
+                  group_constrained: bool = None,
+                  without_team: bool = None,
+                  active: bool = None,
+                  inactive: bool = None,
+                  role: str = None,
+                  sort: str = None,
+                  roles: str = None,
+                  channel_roles: str = None,
+                  team_roles: str = None) -> dict:
+        """
+        Get a page of a list of users.
+        Based on query string parameters, select users from a team,
+        channel, or select users not in a specific channel.
+
+        Requires an active session and (if specified) membership
+        to the channel or team being selected from.
+
+        :param page: Default: 0. The page to select.
+        :param per_page: Default: 60. The number of users per page.
+        :param in_team: The ID of the team to get users for.
+        :param not_in_team: The ID of the team to exclude users for.
+        :param in_channel: The ID of the channel to get users for.
+        :param not_in_channel: The ID of the channel to exclude users for.
+        :param in_group: The ID of the group to get users for.
+        :param group_constrained: When used with not_in_channel or not_in_team, returns only the users that are allowed to join the channel or team based on its group constrains.
+        :param without_team: Whether or not to list users that are not on any team.
+        :param active: Whether or not to list only users that are active.
+        :param inactive: Whether or not to list only users that are deactivated.
+        :param role: Returns users that have this role.
+        :param sort: Sort is only available in conjunction with certain options.
+        :param roles: Comma separated string used to filter users based on any of the specified system roles.
+        :param channel_roles: Comma separated string used to filter users based on any of the specified channel roles, can only be used in conjunction with in_channel.
+        :param team_roles: Comma separated string used to filter users based on any of the specified team roles, can only be used in conjunction with in_team.
+        :return: User page retrieval info.
+        """
+
+        url = f"{self.api_url}"
+        params = {k: v for k, v in (('page', page),
+                                    ('per_page', per_page),
+                                    ('in_team', in_team),
+                                    ('not_in_team', not_in_team),
+                                    ('in_channel', in_channel),
+                                    ('not_in_channel', not_in_channel),
+                                    ('in_group', in_group),
+                                    ('group_constrained', group_constrained),
+                                    ('without_team', without_team),
+                                    ('active', active),
+                                    ('inactive', inactive),
+                                    ('role', role),
+                                    ('sort', sort),
+                                    ('roles', roles),
+                                    ('channel_roles', channel_roles),
+                                    ('team_roles', team_roles))
+                  if v is not None}
+
+        return self.request(url, request_type='GET', params=params)
+
+    def iter_users(self, per_page: int = 200, **filters):
+        """
+        Iterate over every user matching the filters, yielding them
+        one at a time. While the caller processes page N, page N+1 is
+        already being fetched on a single prefetch thread, so network
+        wait overlaps caller CPU and peak memory stays at one page.
+
+        Requires an active session and (if specified) membership
+        to the channel or team being selected from.
+
+        :param per_page: The number of users fetched per request.
+        :param filters: Any get_users keyword filters.
+        :return: A generator of user objects.
+        """
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            page = 0
+            future = pool.submit(self.get_users, page=page,
+                                 per_page=per_page, **filters)
+            while True:
+                users = future.result()
+                if not isinstance(users, list) or not users:
+                    return
+                future = (pool.submit(self.get_users, page=page + 1,
+                                      per_page=per_page, **filters)
+                          if len(users) == per_page else None)
+                yield from users
+                if future is None:
+                    return
+                page += 1
+
+    def get_users_by_ids(self,
+                         user_ids: list[str],
+                         since: int = None) -> dict:
+        """
+        Get a list of users based on a provided list of user IDs.
+
+        Requires an active session but no other permissions.
+
+        :param user_ids: The list of user IDs.
+        :param since: Only return users that have been modified since the given Unix timestamp (in milliseconds).
+        :return: User list retrieval info.
+        """
+
+        url = self.api_url + '/ids'
+        params = {k: v for k, v in (('since', since),) if v is not None}
+        # Материализуем генераторы/итераторы один раз: сериализатор
+        # получает однородный список строк и идёт по быстрому пути.
+        if user_ids is not None and not isinstance(user_ids, (list, tuple)):
+            user_ids = list(user_ids)
+
+        return self.request(url, request_type='POST',
+                            params=params,
+                            body=user_ids if user_ids else ())
+
+    def get_users_bulk(self,
+                       user_ids: list[str],
+                       chunk_size: int = 200,
+                       since: int = None) -> list:
+        """
+        Resolve many user IDs through the batch /ids endpoint,
+        transparently chunked: N per-ID round trips coalesce into
+        ceil(N/chunk_size) requests, which is the cheap replacement
+        for calling get_user in a loop.
+
+        Requires an active session but no other permissions.
+
+        :param user_ids: The list of user IDs.
+        :param chunk_size: The number of IDs resolved per request.
+        :param since: Only return users that have been modified since the given Unix timestamp (in milliseconds).
+        :return: The resolved users, concatenated across chunks.
+        """
+
+        users = []
+        for i in range(0, len(user_ids), chunk_size):
+            page = self.get_users_by_ids(user_ids[i:i + chunk_size],
+                                         since=since)
+            if isinstance(page, list):
+                users.extend(page)
+        return users
+
+    def get_users_by_usernames(self, usernames: list[str]) -> dict:
+        """
+        Get a list of users based on a provided list of usernames.
+
+        Requires an active session but no other permissions.
+
+        :param usernames: The list of usernames.
+        :return: User list retrieval info.
+        """
+
+        url = self.api_url + '/usernames'
+        if usernames is not None and not isinstance(usernames, (list, tuple)):
+            usernames = list(usernames)
+
+        return self.request(url, request_type='POST',
+                            body=usernames if usernames else ())
+
+    @cached_get(ttl=60)
+    def _get_user_cached(self, user_id: str) -> dict:
+        url = self.api_url + _PATH_USER % (user_id,)
+
+        return self.request(url, request_type='GET')
+
+    def get_user(self, user_id: str) -> dict:
+        """
+        Get a user a object. Sensitive information will be sanitized out.
+        Repeat lookups of the same ID within 60 seconds are served from
+        an in-process TTL cache; mutations through this class invalidate
+        it, and user_id="me" always bypasses it.
+
+        Requires an active session but no other permissions.
+
+        :param user_id: User GUID. This can also be "me" which will point to the current user.
+        :return: User retrieval info.
+        """
+
+        if user_id == 'me':
+            url = self.api_url + _PATH_USER % (user_id,)
+            return self.request(url, request_type='GET')
+        return self._get_user_cached(user_id)
+
+    def get_user_by_username(self, username: str) -> dict:
+        """
+        Get a user object by providing a username.
+        Sensitive information will be sanitized out.
+
+        Requires an active session but no other permissions.
+
+        :param username: Username.
+        :return: User retrieval info.
+        """
+
+        key = ('_miss_username', username)
+        expiry = self._cache.get(key)
+        if expiry is not None and time.monotonic() < expiry:
+            return {}
+
+        url = self.api_url + '/username/' + _enc(username)
+
+        result = self.request(url, request_type='GET')
+        if self.last_status == 404:
+            self._cache[key] = time.monotonic() + 60
+        return result
+
+    @cached_get(ttl=60)
+    def get_user_by_email(self, email: str) -> dict:
+        """
+        Get a user object by providing a user email.
+        Sensitive information will be sanitized out.
+        Repeat lookups of the same email within 60 seconds are served
+        from the in-process TTL cache; user updates invalidate it.
+
+        Requires an active session and for the current session
+        to be able to view another user's email based on the
+        server's privacy settings.
+
+        :param email: User email.
+        :return: User retrieval info.
+        """
+
+        key = ('_miss_email', email)
+        expiry = self._cache.get(key)
+        if expiry is not None and time.monotonic() < expiry:
+            return {}
+
+        url = self.api_url + '/email/' + _enc(email)
+
+        result = self.request(url, request_type='GET')
+        if self.last_status == 404:
+            self._cache[key] = time.monotonic() + 60
+        return result
+
+    def get_user_sessions(self, user_id: str) -> dict:
+        """
+        Get a list of sessions by providing the user GUID.
+        Sensitive information will be sanitized out.
+
+        Must be logged in as the user being updated
+        or have the edit_other_users permission.
+
+        :param user_id: User GUID.
+        :return: User session retrieval info.
+        """
+
+        url = self.api_url + _PATH_SESSIONS % (user_id,)
+
+        return self.request(url, request_type='GET')
+
+    def revoke_user_session(self,
+                            user_id: str,
+                            session_id: str) -> dict:
+        """
+        Revokes a user session from the provided user ID
+        and session ID strings.
+
+        Must be logged in as the user being updated
+        or have the revoke_user_access_token permission.
+
+        :param user_id: User GUID.
+        :param session_id: The session GUID to revoke.
+        :return: User session revocation info.
+        """
+
+        url = self.api_url + _PATH_REVOKE % (user_id,)
+        body = {'session_id': session_id}
+
+        return self.request(url, request_type='POST', body=body)
+
+    def revoke_all_active_sessions_for_user(self, user_id: str) -> dict:
+        """
+        Revokes all user sessions from the provided user ID
+        and session ID strings.
+
+        Must be logged in as the user being updated
+        or have the edit_other_users permission.
+
+        Minimum server version: 4.4
+
+        :param user_id: User GUID.
+        :return: User session revocation info.
+        """
+
+        url = self.api_url + _PATH_REVOKE_ALL % (user_id,)
+
+        return self._request_nobody(url, 'POST')
+
+    def revoke_user_sessions(self,
+                             user_id: str,
+                             session_ids: list[str],
+                             revoke_all_threshold: int = None,
+                             max_workers: int = 8) -> list:
+        """
+        Revoke many sessions of one user, overlapping the per-session
+        POSTs on a thread pool instead of issuing them serially. When
+        revoke_all_threshold is set and at least that many sessions are
+        listed, the single revoke-all endpoint is called instead —
+        one round trip, at the cost of also revoking any session not
+        in the list.
+
+        Must be logged in as the user being updated
+        or have the revoke_user_access_token permission.
+
+        :param user_id: User GUID.
+        :param session_ids: The session GUIDs to revoke.
+        :param revoke_all_threshold: Opt-in: coalesce into revoke-all at this many sessions.
+        :param max_workers: The number of concurrent revocations.
+        :return: Per-session revocation infos, in input order, or the single revoke-all info.
+        """
+
+        if (revoke_all_threshold is not None
+                and len(session_ids) >= revoke_all_threshold):
+            return [self.revoke_all_active_sessions_for_user(user_id)]
+        if len(session_ids) <= 1:
+            return [self.revoke_user_session(user_id, session_id)
+                    for session_id in session_ids]
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(
+                lambda session_id: self.revoke_user_session(user_id,
+                                                            session_id),
+                session_ids))
+
+    def get_user_audits(self, user_id: str) -> dict:
+        """
+        Get a list of audit by providing the user GUID.
+
+        Must be logged in as the user or have the edit_other_users
+        permission.
+
+        :param user_id: User GUID.
+        :return: User audits retrieval info.
+        """
+
+        url = self.api_url + _PATH_AUDITS % (user_id,)
+
+        return self.request(url, request_type='GET')
+
+    def update_user(self,
+                    user_id: str,
+                    id: str,
+                    email: str = None,
+                    username: str = None,
+                    first_name: str = None,
+                    last_name: str = None,
+                    nickname: str = None,
+                    locale: str = None,
+                    position: str = None,
+                    props: dict = None,
+                    notify_props: dict = None) -> dict:
+        """
+        Update a user by providing the user object.
+        The fields that can be updated are defined in the request body,
+        all other provided fields will be ignored.
+        Any fields not included in the request body will be set
+        to null or reverted to default values.
+
+        Must be logged in as the user being updated
+        or have the edit_other_users permission.
+
+        :param user_id: User GUID.
+        :param id: The user's ID.
+        :param email: User's email.
+        :param username: User's name.
+        :param first_name: User's first name.
+        :param last_name: User's last name.
+        :param nickname: User's nickname.
+        :param locale: User's locale.
+        :param position: User's position.
+        :param props: User's props.
+        :param notify_props: User's notify props.
+        :return: User update info.
+        """
+
+        url = self.api_url + _PATH_USER % (user_id,)
+        self.invalidate('_get_user')
+        self.invalidate('get_user_by_')
+        body = {'id': id}
+        body.update({k: v for k, v in (('email', email),
+                                       ('username', username),
+                                       ('first_name', first_name),
+                                       ('last_name', last_name),
+                                       ('nickname', nickname),
+                                       ('locale', locale),
+                                       ('position', position),
+                                       ('props', props),
+                                       ('notify_props', notify_props))
+                     if v is not None})
+
+        return self.request(url, request_type='PUT', body=body)
+
+    def patch_user(self,
+                   user_id: str,
+                   email: str = None,
+                   username: str = None,
+                   first_name: str = None,
+                   last_name: str = None,
+                   nickname: str = None,
+                   locale: str = None,
+                   position: str = None,
+                   props: dict = None,
+                   notify_props: dict = None) -> dict:
+        """
+        Partially update a user by providing only the fields
+        you want to update. Omitted fields will not be updated.
+        The fields that can be updated are defined in the request body,
+        all other provided fields will be ignored.
+
+        Must be logged in as the user being updated
+        or have the edit_other_users permission.
+
+        :param user_id: User GUID.
+        :param email: User's email.
+        :param username: User's name.
+        :param first_name: User's first name.
+        :param last_name: User's last name.
+        :param nickname: User's nickname.
+        :param locale: User's locale.
+        :param position: User's position.
+        :param props: User's props.
+        :param notify_props: User's notify props.
+        :return: User patch info.
+        """
+
+        url = self.api_url + _PATH_PATCH % (user_id,)
+        self.invalidate('_get_user')
+        self.invalidate('get_user_by_')
+        body = {k: v for k, v in (('email', email),
+                                  ('username', username),
+                                  ('first_name', first_name),
+                                  ('last_name', last_name),
+                                  ('nickname', nickname),
+                                  ('locale', locale),
+                                  ('position', position),
+                                  ('props', props),
+                                  ('notify_props', notify_props))
+                if v is not None}
+
+        return self.request(url, request_type='PUT', body=body)
+
+    def deactivate_user_account(self, user_id: str) -> dict:
+        """
+        Deactivates the user and revokes all its sessions
+        by archiving its user object.
+
+        Must be logged in as the user being deactivated
+        or have the edit_other_users permission.
+
+        :param user_id: User GUID.
+        :return: User deactivation info.
+        """
+
+        url = self.api_url + _PATH_USER % (user_id,)
+
+        self.invalidate('_get_user')
+
+        return self._request_nobody(url, 'DEL')
+
+    def get_user_profile_image(self, user_id: str) -> bytes:
+        """
+        Get a user's profile image based on user_id string parameter.
+        Returns the raw image bytes without attempting a JSON parse,
+        streaming the body straight off the socket.
+
+        Must be logged in.
+
+        :param user_id: User GUID.
+        :return: The image bytes.
+        """
+
+        url = self.api_url + _PATH_IMAGE % (user_id,)
+
+        return self._get_raw(url)
+
+    def get_user_default_profile_image(self, user_id: str) -> bytes:
+        """
+        Returns the default (generated) user profile image based on
+        user_id string parameter, as raw bytes without a JSON parse.
+
+        Must be logged in.
+        Minimum server version: 5.5
+
+        :param user_id: User GUID.
+        :return: The image bytes.
+        """
+
+        url = self.api_url + _PATH_IMAGE % (user_id,) + '/default'
+
+        return self._get_raw(url)
+
+    def set_user_profile_image(self, user_id: str, image: str) -> dict:
+        """
+        Set a user's profile image based on user_id string parameter.
+        The open file handle is handed to the transport, which streams
+        the multipart body chunk by chunk instead of buffering the
+        whole image in memory first.
+
+        Must be logged in as the user being updated
+        or have the edit_other_users permission.
+
+        :param user_id: User GUID.
+        :param image: Full path to the image to be uploaded.
+        :return: Profile image info.
+        """
+
+        url = self.api_url + _PATH_IMAGE % (user_id,)
+
+        with open(image, 'rb') as f:
+            files = {'image': (os.path.basename(image), f,
+                               'application/octet-stream')}
+            return self.request(url, request_type='POST', files=files)
+
+    def delete_user_profile_image(self, user_id: str) -> dict:
+        """
+        Delete user's profile image and reset to default image.
+
+        Must be logged in as the user being updated
+        or have the edit_other_users permission.
+
+        Minimum server version: 5.5
+
+        :param user_id: User GUID.
+        :return: Profile image reset info.
+        """
+
+        url = self.api_url + _PATH_IMAGE % (user_id,)
+
+        return self._request_nobody(url, 'DEL')
+
+    def update_user_roles(self, user_id: str, roles: str) -> dict:
+        """
+        Update a user's system-level roles.
+        Valid user roles are "system_user", "system_admin"
+        or both of them.
+
+        Must have the manage_roles permission.
+
+        :param user_id: User GUID.
+        :param roles: Space-delimited system roles to assign to the user.
+        :return: User roles update info.
+        """
+
+        url = self.api_url + _PATH_ROLES % (user_id,)
+        self.invalidate('_get_user')
+        body = {'roles': roles}
+
+        return self.request(url, request_type='PUT', body=body)
+
+    @cached_get(ttl=60)
+    def check_mfa(self, login_id: str) -> dict:
+        """
+        Check if a user has multi-factor authentication active on
+        their account by providing a login ID. Used to check whether
+        an MFA code needs to be provided when logging in. The answer
+        for a given login ID is cached for 60 seconds, since login
+        retries re-ask it immediately; update_user_mfa invalidates it.
+
+        No permission required.
+
+        :param login_id: The email or username used to login.
+        :return: MFA check info.
+        """
+
+        url = self.api_url + '/mfa'
+        body = {'login_id': login_id}
+
+        return self.request(url, request_type='POST', body=body)
+
+    def update_user_mfa(self,
+                        user_id: str,
+                        activate: bool,
+                        code: str = None) -> dict:
+        """
+        Activates multi-factor authentication for the user if activate
+        is true and a valid code is provided. If activate is false,
+        then code is not required and multi-factor authentication is
+        disabled for the user.
+
+        Must be logged in as the user being updated
+        or have the edit_other_users permission.
+
+        :param user_id: User GUID.
+        :param activate: Use true to activate, false to deactivate.
+        :param code: The code produced by the MFA client, e.g. a Google Authenticator code.
+        :return: User MFA update info.
+        """
+
+        url = self.api_url + _PATH_MFA % (user_id,)
+        self.invalidate('check_mfa')
+        self.invalidate('_get_user')
+        body = {'activate': activate}
+        if code is not None:
+            body['code'] = code
+
+        return self.request(url, request_type='PUT', body=body)
+
+    def autocomplete_users(self,
+                           name: str,
+                           in_team: str = None,
+                           in_channel: str = None,
+                           limit: int = None) -> dict:
+        """
+        Get a list of users for the purpose of autocompleting
+        based on the provided search term.
+        Specify a combination of team_id and channel_id
+        to filter results further.
+
+        Requires an active session and view_team and read_channel
+        on any teams or channels used to filter the results further.
+
+        :param name: Username, nickname, first name or last name.
+        :param in_team: Team ID.
+        :param in_channel: Channel ID.
+        :param limit: Default: 100. The maximum number of users to return in each subresult.
+        :return: User autocomplete info.
+        """
+
+        url = self.api_url + '/autocomplete'
+        params = {'name': name}
+        params.update({k: v for k, v in (('in_team', in_team),
+                                         ('in_channel', in_channel),
+                                         ('limit', limit))
+                      if v is not None})
+
+        return self.request(url, request_type='GET', params=params)
+
+    def search_users(self,
+                     term: str,
+                     team_id: str = None,
+                     not_in_team_id: str = None,
+                     in_channel_id: str = None,
+                     not_in_channel_id: str = None,
+                     in_group_id: str = None,
+                     group_constrained: bool = None,
+                     allow_inactive: bool = None,
+                     without_team: bool = None,
+                     limit: int = None) -> dict:
+        """
+        Get a list of users based on search criteria provided
+        in the request body. Searches are typically done against
+        username, full name, nickname and email.
+
+        Requires an active session and read_channel and/or view_team
+        permissions for any channels or teams specified in the request body.
+
+        :param term: The term to match against username, full name, nickname and email.
+        :param team_id: If provided, only search users on this team.
+        :param not_in_team_id: If provided, only search users not on this team.
+        :param in_channel_id: If provided, only search users in this channel.
+        :param not_in_channel_id: If provided, only search users not in this channel.
+        :param in_group_id: If provided, only search users in this group.
+        :param group_constrained: When used with not_in_channel_id or not_in_team_id, returns only the users that are allowed to join the channel or team based on its group constrains.
+        :param allow_inactive: When true, include deactivated users in the results.
+        :param without_team: Set this to true if you would like to search for users that are not on a team.
+        :param limit: Default: 100. The maximum number of users to return in the results.
+        :return: User search info.
+        """
+
+        url = self.api_url + '/search'
+        body = {'term': term}
+        body.update({k: v for k, v in (('team_id', team_id),
+                                       ('not_in_team_id', not_in_team_id),
+                                       ('in_channel_id', in_channel_id),
+                                       ('not_in_channel_id',
+                                        not_in_channel_id),
+                                       ('in_group_id', in_group_id),
+                                       ('group_constrained',
+                                        group_constrained),
+                                       ('allow_inactive', allow_inactive),
+                                       ('without_team', without_team),
+                                       ('limit', limit))
+                     if v is not None})
+
+        return self.request(url, request_type='POST', body=body)
+
+    def get_total_count_of_users_in_system(self) -> dict:
+        """
+        Get a total count of users in the system.
+
+        Must be authenticated.
+
+        :return: User stats retrieval info.
+        """
+
+        url = self.api_url + '/stats'
+
+        return self.request(url, request_type='GET')
@@ -0,0 +1,170 @@
+import asyncio
+
+from Mattermost_Async_Base import AsyncBase
+from mm_users_api import _enc
+
+
+__all__ = ['AsyncUsers']
+
+
+class AsyncUsers(AsyncBase):
+    __slots__ = ()
+
+    def __init__(self, token: str, server_url: str):
+        super().__init__(token, server_url)
+        self.api_url = f"{self.base_url}/users"
+
+    async def aget_user(self, user_id: str) -> dict:
+        """
+        Get a user object, asynchronously. Mirrors Users.get_user.
+
+        Requires an active session but no other permissions.
+
+        :param user_id: User GUID. This can also be "me" which will point to the current user.
+        :return: User retrieval info.
+        """
+
+        url = f"{self.api_url}/{user_id}"
+
+        return await self.request(url, request_type='GET')
+
+    async def aget_user_by_username(self, username: str) -> dict:
+        """
+        Get a user object by providing a username, asynchronously.
+        Mirrors Users.get_user_by_username.
+
+        Requires an active session but no other permissions.
+
+        :param username: Username.
+        :return: User retrieval info.
+        """
+
+        url = f"{self.api_url}/username/{_enc(username)}"
+
+        return await self.request(url, request_type='GET')
+
+    async def aget_user_sessions(self, user_id: str) -> dict:
+        """
+        Get a list of sessions by providing the user GUID,
+        asynchronously. Mirrors Users.get_user_sessions.
+
+        Must be logged in as the user being updated
+        or have the edit_other_users permission.
+
+        :param user_id: User GUID.
+        :return: User session retrieval info.
+        """
+
+        url = f"{self.api_url}/{user_id}/sessions"
+
+        return await self.request(url, request_type='GET')
+
+    async def aget_user_audits(self, user_id: str) -> dict:
+        """
+        Get a list of audit by providing the user GUID,
+        asynchronously. Mirrors Users.get_user_audits.
+
+        Must be logged in as the user or have the edit_other_users
+        permission.
+
+        :param user_id: User GUID.
+        :return: User audits retrieval info.
+        """
+
+        url = f"{self.api_url}/{user_id}/audits"
+
+        return await self.request(url, request_type='GET')
+
+    async def aget_users_bulk(self,
+                              user_ids: list[str],
+                              concurrency: int = 32) -> list:
+        """
+        Fetch many user objects concurrently under a bounded
+        semaphore, so N independent lookups cost
+        ~ceil(N/concurrency) round trips of latency instead of N.
+
+        Requires an active session but no other permissions.
+
+        :param user_ids: The user GUIDs to fetch.
+        :param concurrency: The number of requests in flight at once.
+        :return: The fetched users, in input order.
+        """
+
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(user_id: str):
+            async with sem:
+                return await self.aget_user(user_id)
+
+        return await asyncio.gather(*[one(user_id)
+                                      for user_id in user_ids])
+
+    async def _agather_by_user(self, fetch, user_ids, concurrency):
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(user_id: str):
+            async with sem:
+                return user_id, await fetch(user_id)
+
+        results = await asyncio.gather(*[one(user_id)
+                                         for user_id in user_ids])
+        return dict(results)
+
+    async def aget_user_audits_bulk(self,
+                                    user_ids: list[str],
+                                    concurrency: int = 32) -> dict:
+        """
+        Fetch the audits of many users concurrently, keyed by user ID,
+        so an admin sweep over N users costs ~ceil(N/concurrency)
+        round trips of latency instead of N.
+
+        Must be logged in as the user or have the edit_other_users
+        permission.
+
+        :param user_ids: The user GUIDs to fetch audits for.
+        :param concurrency: The number of requests in flight at once.
+        :return: A dict mapping user ID to its audits retrieval info.
+        """
+
+        return await self._agather_by_user(self.aget_user_audits,
+                                           user_ids, concurrency)
+
+    async def aget_user_sessions_bulk(self,
+                                      user_ids: list[str],
+                                      concurrency: int = 32) -> dict:
+        """
+        Fetch the sessions of many users concurrently, keyed by user
+        ID. Same shape as aget_user_audits_bulk.
+
+        Must be logged in as the user being updated
+        or have the edit_other_users permission.
+
+        :param user_ids: The user GUIDs to fetch sessions for.
+        :param concurrency: The number of requests in flight at once.
+        :return: A dict mapping user ID to its session retrieval info.
+        """
+
+        return await self._agather_by_user(self.aget_user_sessions,
+                                           user_ids, concurrency)
+
+    def get_user_audits_bulk(self,
+                             user_ids: list[str],
+                             concurrency: int = 32) -> dict:
+        """
+        Sync shim over aget_user_audits_bulk for callers without an
+        event loop: runs the concurrent fetches via asyncio.run and
+        closes the session afterwards.
+
+        :param user_ids: The user GUIDs to fetch audits for.
+        :param concurrency: The number of requests in flight at once.
+        :return: A dict mapping user ID to its audits retrieval info.
+        """
+
+        async def run():
+            try:
+                return await self.aget_user_audits_bulk(
+                    user_ids, concurrency=concurrency)
+            finally:
+                await self.close()
+
+        return asyncio.run(run())
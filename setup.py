@@ -28,5 +28,12 @@ install_requires = [
     'requests'
 ]
 
+extras_require = {
+    'async': ['aiohttp'],
+    'http2': ['httpx[http2]'],
+    'speed': ['msgspec', 'zstandard', 'brotli'],
+}
+
 if __name__ == '__main__':
-    setup(**setup_args, install_requires=install_requires)
+    setup(**setup_args, install_requires=install_requires,
+          extras_require=extras_require)